@@ -9,14 +9,24 @@ import json
 import logging
 import os
 import re
-import sqlite3
+import sys
+import time
+import functools
+import aiosqlite
 import bcrypt
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
-from collections import defaultdict, deque
-import aiohttp
+from collections import OrderedDict, deque
+from itertools import islice
+
+from intent_disambiguation import classify_intent
+from tools import (
+    ClimateTools, MusicTools, VehicleTools, NavigationTools, VehicleInfoTools,
+    get_complete_vehicle_state, close_http_session
+)
 
 # Groq AI integration
 try:
@@ -26,8 +36,197 @@ except ImportError:
     GROQ_AVAILABLE = False
     print("⚠️ Groq not installed. Install with: pip install groq")
 
+# Fast JSON (de)serialization, falls back to stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# ====================== PRECOMPILED PATTERNS ======================
+
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile keywords into one alternation regex with plain substring semantics"""
+    return re.compile("|".join(re.escape(keyword) for keyword in keywords))
+
+# Climate
+_TEMP_RE = re.compile(r'(\d+)\s*(?:degrees?|°)')
+_CLIMATE_AC_RE = _keyword_pattern(['ac', 'air conditioning'])
+_CLIMATE_WARMER_RE = _keyword_pattern(['hot', 'warm', 'increase', 'up'])
+_CLIMATE_COOLER_RE = _keyword_pattern(['cold', 'cool', 'decrease', 'down'])
+
+# Entertainment
+_VOL_RE = re.compile(r'volume\s*(?:to\s*)?(\d+)')
+_MUSIC_PAUSE_RE = _keyword_pattern(['pause', 'stop'])
+_MUSIC_PLAY_RE = _keyword_pattern(['play', 'start'])
+_MUSIC_NEXT_RE = _keyword_pattern(['next', 'skip'])
+_MUSIC_PREVIOUS_RE = _keyword_pattern(['previous', 'back'])
+
+# Vehicle control
+_LIGHTS_RE = _keyword_pattern(['lights', 'headlights'])
+
+# Navigation
+_WEATHER_RE = _keyword_pattern([
+    'weather', 'forecast', 'temperature outside', 'climate outside',
+    'is it raining', 'will it rain', 'sunny', 'cloudy', 'weather report',
+    'current weather', 'weather conditions', 'atmospheric conditions'
+])
+_LOCATION_RE = _keyword_pattern([
+    'where am i', 'current location', 'my location', 'where are we',
+    'what is my location', 'tell me where i am', 'show location',
+    'gps position', 'coordinates', 'position update'
+])
+_PLACE_SEARCH_RE = _keyword_pattern([
+    'find', 'search', 'locate', 'look for', 'nearest', 'nearby', 'close',
+    'suggest', 'recommend', 'show me', 'places', 'visit', 'tourist',
+    'attraction', 'sightseeing', 'spots', 'points of interest'
+])
+_DIRECTIONS_RE = _keyword_pattern([
+    'navigate', 'directions', 'route', 'go to', 'take me to',
+    'drive to', 'head to', 'guide me to', 'show route to'
+])
+
+_DEST_PATTERN_SOURCES = [
+    # FIXED: Proper spacing for optional me/us group
+    r'(?:navigate|directions?|route|guide)\s+(?:(?:me|us)\s+)?to\s+(.+)',
+    r'(?:go|drive|take\s+me|head)\s+to\s+(.+)',
+    r'how\s+(?:do\s+i|can\s+i)\s+get\s+to\s+(.+)',
+    r'(?:show|get|give)\s+(?:me|us)\s+(?:directions?|route)\s+(?:to|for)\s+(.+)',
+    r'(?:plot|plan)\s+(?:a\s+)?(?:course|route)\s+to\s+(.+)',
+    # ADDED: Additional patterns for common variations
+    r'directions?\s+(?:to|for)\s+(.+)',
+    r'route\s+to\s+(.+)',
+    r'where\s+is\s+(.+)',
+    r'find\s+route\s+to\s+(.+)'
+]
+# One anchored pattern: each branch lazily skips ahead to its own match, so
+# branches are tried in list order exactly like searching each pattern in turn.
+# Every source has one capture group, so match.lastindex names the winner.
+_DEST_RE = re.compile(
+    "^(?:" + "|".join(f"[\\s\\S]*?{pattern}" for pattern in _DEST_PATTERN_SOURCES) + ")",
+    re.IGNORECASE
+)
+_DEST_TRAIL_RE = re.compile(r'\s+(?:please|now|immediately)\s*$', re.IGNORECASE)
+
+# Place keywords match whole words: single words by token lookup, multi-word
+# phrases by a word-bounded regex (so "inn" no longer fires on "dinner", nor
+# "eat" on "weather"). Word forms worth catching are listed as keywords.
+_WORD_RE = re.compile(r"[a-z]+")
+
+def _phrase_pattern(phrases: List[str]) -> re.Pattern:
+    """Compile multi-word phrases into one word-bounded lookahead alternation"""
+    return re.compile(r"(?=\b(" + "|".join(re.escape(phrase) for phrase in phrases) + r")\b)")
+
+def _token_in(token: str, words) -> Optional[str]:
+    """Return the keyword a token matches, accepting a simple plural form"""
+    if token in words:
+        return token
+    if token.endswith('s') and token[:-1] in words:
+        return token[:-1]
+    return None
+
+_TOURIST_QUERY_WORDS = frozenset({'visit', 'tourist', 'attraction', 'sightseeing'})
+_TOURIST_QUERY_PHRASE_RE = _phrase_pattern([
+    'places to visit', 'tourist attractions', 'must visit', 'worth visiting', 'suggest places',
+    'recommend places', 'interesting places', 'beautiful places', 'famous places'
+])
+
+# Place type rules in priority order: (place_type, log message, keywords).
+# Category strings are returned and used as keys downstream; intern them once
+_PLACE_TYPE_RULES = [(sys.intern(place_type), log_message, keywords) for place_type, log_message, keywords in (
+    # 🔧 FIXED: Hotel/lodging detection (HIGH PRIORITY)
+    ('lodging', "🔧 Detected hotel/lodging request", [
+        'hotel', 'hotels', 'lodging', 'accommodation', 'stay', 'guest house',
+        'resort', 'resorts', 'inn', 'motel', 'bed and breakfast', 'bnb',
+        'place to stay', 'where to stay', 'accommodation options', 'staying'
+    ]),
+    # 🔧 ENHANCED: Tourist attractions and sightseeing
+    ('tourist_attraction', "🔧 Detected tourist attraction request", [
+        'visit', 'tourist', 'attraction', 'sightseeing', 'landmark', 'monument',
+        'places to visit', 'tourist attractions', 'sightseeing spots', 'points of interest',
+        'tourist places', 'visiting spots', 'places to see', 'must visit', 'tourist spots',
+        'scenic places', 'beautiful places', 'famous places', 'popular places',
+        'suggest places', 'recommend places', 'interesting places', 'worth visiting',
+        'visiting', 'visited'
+    ]),
+    ('place_of_worship', "🔧 Detected worship place request", [
+        'temple', 'temples', 'church', 'churches', 'mosque', 'mosques', 'worship', 'religious', 'pray', 'prayer', 'shrine',
+        'praying'
+    ]),
+    ('restaurant', "🔧 Detected restaurant request", [
+        'restaurant', 'restaurants', 'food', 'eat', 'dine', 'dining', 'meal', 'lunch', 'dinner', 'breakfast',
+        'eating', 'eatery', 'eateries', 'dined', 'lunches'
+    ]),
+    ('shopping_mall', "🔧 Detected shopping request", [
+        'mall', 'shopping', 'store', 'shop', 'shops', 'market', 'shopping center', 'bazaar', 'retail',
+        'supermarket'
+    ]),
+    ('hospital', "🔧 Detected hospital request", [
+        'hospital', 'hospitals', 'medical', 'clinic', 'doctor', 'health', 'pharmacy', 'medical center',
+        'healthcare', 'pharmacies'
+    ]),
+    ('cafe', "🔧 Detected cafe request", [
+        'coffee', 'cafe', 'cafes', 'coffee shop', 'tea', 'beverages', 'cafeteria'
+    ]),
+    ('gas_station', "🔧 Detected gas station request", [
+        'gas', 'fuel', 'petrol', 'station', 'gas station', 'fuel station',
+        'gasoline', 'fueling', 'refuel', 'refueling'
+    ]),
+    ('bank', "🔧 Detected bank request", [
+        'bank', 'banks', 'atm', 'banking', 'financial'
+    ]),
+    # 🔧 ENHANCED: General place queries default to tourist attractions
+    ('tourist_attraction', "🔧 General places query - defaulting to tourist attractions", [
+        'places', 'spots', 'locations', 'areas', 'somewhere', 'anywhere'
+    ]),
+)]
+
+# One named group per rule (in priority order), each a word-bounded alternation
+# that also accepts a plural "s". Inside the zero-width lookahead the first rule
+# that matches at a position wins, and finditer visits every word start, so the
+# highest-priority rule anywhere in the message is the minimum over the hits.
+_PLACE_RE = re.compile("(?=" + "|".join(
+    rf"(?P<rule{index}>\b(?:" + "|".join(
+        re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+    ) + r")s?\b)"
+    for index, (_, _, keywords) in enumerate(_PLACE_TYPE_RULES)
+) + ")")
+_PLACE_GROUP_RULE = {f"rule{index}": index for index in range(len(_PLACE_TYPE_RULES))}
+
+# Vehicle info: full model names first, then bare makes mapped to their model.
+# Index in this list is the match priority.
+_VEHICLE_KEYWORDS: List[Tuple[str, str]] = [(keyword, sys.intern(vehicle)) for keyword, vehicle in (
+    ('tesla model 3', 'tesla model 3'), ('bmw 3 series', 'bmw 3 series'),
+    ('honda civic', 'honda civic'), ('ford f-150', 'ford f-150'),
+    ('ram 1500', 'ram 1500'), ('toyota tacoma', 'toyota tacoma'),
+    ('tesla', 'tesla model 3'), ('bmw', 'bmw 3 series'),
+    ('honda', 'honda civic'), ('ford', 'ford f-150'),
+)]
+_VEHICLE_PRIORITY = {keyword: index for index, (keyword, _) in enumerate(_VEHICLE_KEYWORDS)}
+_VEHICLE_SCAN_RE = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword, _ in _VEHICLE_KEYWORDS) + "))")
+
+# Vehicle info type: first rule with a matching word wins
+_INFO_RULES: List[Tuple[frozenset, str]] = [(keywords, sys.intern(info_type)) for keywords, info_type in (
+    (frozenset({'engine', 'power', 'performance'}), 'engine'),
+    (frozenset({'features', 'technology'}), 'features'),
+    (frozenset({'price', 'cost'}), 'price'),
+    (frozenset({'pros', 'cons'}), 'pros'),
+)]
+
 class AgentType(Enum):
     MASTER = "master"
     VEHICLE_CONTROL = "vehicle_control"
@@ -37,7 +236,7 @@ class AgentType(Enum):
     USER_EXPERIENCE = "user_experience"
     VEHICLE_INFO = "vehicle_info"
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     content: str
     user_id: str
@@ -47,14 +246,17 @@ class AgentMessage:
     actions_taken: List[str] = None
     vehicle_state: Dict = None
     user_location: Optional[Dict] = None
+    # Lowercased content, computed once and shared by every keyword extractor
+    content_lower: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
+        self.content_lower = self.content.lower()
         if self.actions_taken is None:
             self.actions_taken = []
         if self.vehicle_state is None:
             self.vehicle_state = {}
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     user_id: str
     username: str
@@ -69,38 +271,106 @@ class UserProfile:
     preferred_volume: int = 50
     
     def to_dict(self) -> Dict:
-        data = asdict(self)
-        data['created_at'] = self.created_at.isoformat()
-        data['last_active'] = self.last_active.isoformat()
-        return data
+        # Built directly rather than with asdict(), which deep-copies vehicle_data
+        return {
+            'user_id': self.user_id,
+            'username': self.username,
+            'email': self.email,
+            'vehicle_type': self.vehicle_type,
+            'vehicle_model': self.vehicle_model,
+            'vehicle_data': self.vehicle_data,
+            'created_at': self.created_at.isoformat(),
+            'last_active': self.last_active.isoformat(),
+            'total_interactions': self.total_interactions,
+            'preferred_temperature': self.preferred_temperature,
+            'preferred_volume': self.preferred_volume
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'UserProfile':
-        data = data.copy()
-        data['created_at'] = datetime.fromisoformat(data['created_at'])
-        data['last_active'] = datetime.fromisoformat(data['last_active'])
-        return cls(**data)
+        return cls(**{
+            **data,
+            'created_at': datetime.fromisoformat(data['created_at']),
+            'last_active': datetime.fromisoformat(data['last_active'])
+        })
 
 class MemoryManager:
     """Enhanced memory manager with authentication and chat history"""
     
-    def __init__(self):
+    def __init__(self, bcrypt_cost: Optional[int] = None):
         self.database_file = "data/users.db"
-        self.interaction_history: Dict[str, List[Dict]] = defaultdict(list)
+        self.db: Optional[aiosqlite.Connection] = None
+        self._write_lock = asyncio.Lock()  # SQLite allows a single writer at a time
+        # bcrypt is CPU-bound, so hash/verify in worker processes off the event loop.
+        # Each +1 of cost doubles hashing time (~100 ms at 10, ~400 ms at 12, ~1.6 s at 14),
+        # so use BCRYPT_COST=4 in dev/tests and 12+ in production.
+        self.bcrypt_cost = bcrypt_cost if bcrypt_cost is not None else int(os.getenv("BCRYPT_COST", "12"))
+        self._bcrypt_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        # Short-lived cache of authenticated user_ids -> expiry (monotonic seconds),
+        # in LRU order: hits move to the end, the front is evicted when full
+        self._auth_cache: "OrderedDict[str, float]" = OrderedDict()
+        self.auth_cache_ttl = 60.0
+        self.auth_cache_maxsize = 4096
+        # Bounded per-user history: append is O(1) and the oldest entries drop off
+        # Users are kept in LRU order and capped; evicted users reload from SQLite
+        self.history_size = 50
+        self.max_cached_users = 10_000
+        self.interaction_history: "OrderedDict[str, deque]" = OrderedDict()
+        # user_id -> (newest interaction, last-20 snapshot); stale once a new interaction lands
+        self._memory_cache: Dict[str, Tuple[Optional[Dict], List[Dict]]] = {}
+        # Interactions are persisted in batches by a background task
+        self._write_q: asyncio.Queue = asyncio.Queue(maxsize=10000)
+        self._flush_task: Optional[asyncio.Task] = None
+        self.flush_batch_size = 100
+        self.flush_interval = 1.0
         self.user_profiles: Dict[str, UserProfile] = {}
         os.makedirs("data", exist_ok=True)
         
     async def initialize(self):
         """Initialize database and load data"""
         await self._init_database()
+        self._flush_task = asyncio.create_task(self._flush_interactions())
         logger.info("✅ Memory Manager initialized")
     
+    async def shutdown(self):
+        """Flush pending interactions and close the shared database connection"""
+        if self._flush_task is not None:
+            await self._write_q.put(None)  # Sentinel: write what is queued, then stop
+            await self._flush_task
+            self._flush_task = None
+        if self.db is not None:
+            await self.db.close()
+            self.db = None
+            logger.info("🔄 Memory Manager database closed")
+        self._bcrypt_pool.shutdown(wait=False, cancel_futures=True)
+    
+    async def _hash_password(self, password: str) -> str:
+        """Hash a password in the bcrypt worker pool"""
+        loop = asyncio.get_running_loop()
+        password_hash = await loop.run_in_executor(
+            self._bcrypt_pool, bcrypt.hashpw, password.encode('utf-8'), bcrypt.gensalt(self.bcrypt_cost)
+        )
+        return password_hash.decode('utf-8')
+    
+    async def _check_password(self, password: str, password_hash: str) -> bool:
+        """Verify a password against its hash in the bcrypt worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._bcrypt_pool, bcrypt.checkpw, password.encode('utf-8'), password_hash.encode('utf-8')
+        )
+    
     async def _init_database(self):
-        """Initialize SQLite database"""
-        conn = sqlite3.connect(self.database_file)
-        cursor = conn.cursor()
+        """Open the long-lived SQLite connection and initialize schema"""
+        self.db = await aiosqlite.connect(self.database_file)
+        self.db.row_factory = aiosqlite.Row
+        
+        # Tune the connection once for its whole lifetime
+        await self.db.execute("PRAGMA journal_mode=WAL")
+        await self.db.execute("PRAGMA temp_store=memory")
+        await self.db.execute("PRAGMA synchronous=NORMAL")
+        await self.db.execute("PRAGMA cache_size=-64000")
         
-        cursor.execute('''
+        await self.db.execute('''
             CREATE TABLE IF NOT EXISTS users (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 username TEXT UNIQUE NOT NULL,
@@ -115,34 +385,110 @@ class MemoryManager:
             )
         ''')
         
-        conn.commit()
-        conn.close()
+        # Partial index covering the active-user lookups used by login and auth checks
+        await self.db.execute("CREATE INDEX IF NOT EXISTS idx_users_active ON users(username) WHERE is_active = 1")
+        
+        await self.db.execute('''
+            CREATE TABLE IF NOT EXISTS interactions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id TEXT NOT NULL,
+                ts REAL NOT NULL,
+                user_input TEXT NOT NULL,
+                agent_response TEXT NOT NULL,
+                agent_id TEXT,
+                actions TEXT NOT NULL
+            )
+        ''')
+        await self.db.execute("CREATE INDEX IF NOT EXISTS idx_interactions_user_ts ON interactions(user_id, ts DESC)")
+        
+        await self.db.commit()
+    
+    async def _flush_interactions(self):
+        """Background task: write queued interactions in batched transactions"""
+        loop = asyncio.get_running_loop()
+        running = True
+        while running:
+            row = await self._write_q.get()
+            if row is None:
+                break
+            batch = [row]
+            
+            # Collect up to flush_batch_size rows or until flush_interval elapses
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.flush_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    row = await asyncio.wait_for(self._write_q.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if row is None:
+                    running = False
+                    break
+                batch.append(row)
+            
+            try:
+                async with self._write_lock:
+                    await self.db.executemany(
+                        "INSERT INTO interactions (user_id, ts, user_input, agent_response, agent_id, actions) VALUES (?, ?, ?, ?, ?, ?)",
+                        batch
+                    )
+                    await self.db.commit()
+            except Exception as e:
+                logger.error(f"Error persisting {len(batch)} interactions: {e}")
+    
+    async def _get_history(self, user_id: str) -> deque:
+        """Get a user's in-memory history, loading it from the database on first use"""
+        history = self.interaction_history.get(user_id)
+        if history is not None:
+            self.interaction_history.move_to_end(user_id)
+            return history
+        
+        history = deque(maxlen=self.history_size)
+        async with self.db.execute('''
+            SELECT ts, user_input, agent_response, agent_id, actions
+            FROM interactions WHERE user_id = ? ORDER BY ts DESC LIMIT ?
+        ''', (user_id, self.history_size)) as cursor:
+            rows = await cursor.fetchall()
+        
+        for ts, user_input, agent_response, agent_id, actions in reversed(rows):
+            history.append({
+                "timestamp": datetime.fromtimestamp(ts).isoformat(),
+                "user_input": user_input,
+                "agent_response": agent_response,
+                "agent_id": agent_id,
+                "actions_taken": json_loads(actions)
+            })
+        
+        # Another coroutine may have loaded the same user while we awaited
+        history = self.interaction_history.setdefault(user_id, history)
+        while len(self.interaction_history) > self.max_cached_users:
+            evicted_user, _ = self.interaction_history.popitem(last=False)
+            self._memory_cache.pop(evicted_user, None)
+        return history
     
     async def register_user(self, username: str, email: str, password: str, 
                            vehicle_type: str, vehicle_model: str, vehicle_data: Dict) -> Tuple[bool, str, Optional[Dict]]:
         """Register new user"""
         try:
-            conn = sqlite3.connect(self.database_file)
-            cursor = conn.cursor()
-            
             # Check if user exists
-            cursor.execute("SELECT id FROM users WHERE username = ? OR email = ?", (username, email))
-            if cursor.fetchone():
-                conn.close()
-                return False, "Username or email already exists", None
+            async with self.db.execute("SELECT id FROM users WHERE username = ? OR email = ?", (username, email)) as cursor:
+                if await cursor.fetchone():
+                    return False, "Username or email already exists", None
             
             # Hash password and insert user
-            password_hash = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-            cursor.execute('''
-                INSERT INTO users (username, email, password_hash, vehicle_type, vehicle_model, vehicle_data)
-                VALUES (?, ?, ?, ?, ?, ?)
-            ''', (username, email, password_hash, vehicle_type, vehicle_model, json.dumps(vehicle_data)))
-            
-            user_id = cursor.lastrowid
-            conn.commit()
-            conn.close()
+            password_hash = await self._hash_password(password)
+            async with self._write_lock:
+                async with self.db.execute('''
+                    INSERT INTO users (username, email, password_hash, vehicle_type, vehicle_model, vehicle_data)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                ''', (username, email, password_hash, vehicle_type, vehicle_model, json_dumps(vehicle_data))) as cursor:
+                    user_id = cursor.lastrowid
+                await self.db.commit()
             
             # Create user profile
+            now = datetime.now()
             user_profile = UserProfile(
                 user_id=username,
                 username=username,
@@ -150,8 +496,8 @@ class MemoryManager:
                 vehicle_type=vehicle_type,
                 vehicle_model=vehicle_model,
                 vehicle_data=vehicle_data,
-                created_at=datetime.now(),
-                last_active=datetime.now()
+                created_at=now,
+                last_active=now
             )
             self.user_profiles[username] = user_profile
             
@@ -162,7 +508,7 @@ class MemoryManager:
                 "vehicleType": vehicle_type,
                 "vehicleModel": vehicle_model,
                 "vehicleData": vehicle_data,
-                "createdAt": datetime.now().isoformat()
+                "createdAt": now.isoformat()
             }
             
             logger.info(f"✅ User registered: {username}")
@@ -175,33 +521,38 @@ class MemoryManager:
     async def authenticate_user(self, username: str, password: str) -> Tuple[bool, str, Optional[Dict]]:
         """Authenticate user login"""
         try:
-            conn = sqlite3.connect(self.database_file)
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT id, username, email, password_hash, vehicle_type, vehicle_model, vehicle_data
-                FROM users WHERE username = ? AND is_active = 1
-            ''', (username,))
-            
-            user_row = cursor.fetchone()
-            if not user_row:
-                conn.close()
+            async with self.db.execute(
+                "SELECT id, password_hash FROM users WHERE username = ? AND is_active = 1", (username,)
+            ) as cursor:
+                credentials = await cursor.fetchone()
+            
+            if not credentials:
                 return False, "User not found", None
             
-            user_id, db_username, email, password_hash, vehicle_type, vehicle_model, vehicle_data_str = user_row
+            user_id = credentials["id"]
             
             # Verify password
-            if not bcrypt.checkpw(password.encode('utf-8'), password_hash.encode('utf-8')):
-                conn.close()
+            if not await self._check_password(password, credentials["password_hash"]):
                 return False, "Invalid password", None
             
+            # Load the profile only after a successful password check
+            async with self.db.execute(
+                "SELECT email, vehicle_type, vehicle_model, vehicle_data FROM users WHERE id = ?", (user_id,)
+            ) as cursor:
+                user_row = await cursor.fetchone()
+            
             # Update last login
-            cursor.execute("UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?", (user_id,))
-            conn.commit()
-            conn.close()
+            async with self._write_lock:
+                await self.db.execute("UPDATE users SET last_login = CURRENT_TIMESTAMP WHERE id = ?", (user_id,))
+                await self.db.commit()
             
-            vehicle_data = json.loads(vehicle_data_str)
+            email = user_row["email"]
+            vehicle_type = user_row["vehicle_type"]
+            vehicle_model = user_row["vehicle_model"]
+            vehicle_data = json_loads(user_row["vehicle_data"])
             
             # Create/update user profile
+            now = datetime.now()
             profile = UserProfile(
                 user_id=username,
                 username=username,
@@ -209,8 +560,8 @@ class MemoryManager:
                 vehicle_type=vehicle_type,
                 vehicle_model=vehicle_model,
                 vehicle_data=vehicle_data,
-                created_at=datetime.now(),
-                last_active=datetime.now()
+                created_at=now,
+                last_active=now
             )
             self.user_profiles[username] = profile
             
@@ -221,7 +572,7 @@ class MemoryManager:
                 "vehicleType": vehicle_type,
                 "vehicleModel": vehicle_model,
                 "vehicleData": vehicle_data,
-                "lastLogin": datetime.now().isoformat()
+                "lastLogin": now.isoformat()
             }
             
             logger.info(f"✅ User authenticated: {username}")
@@ -231,39 +582,63 @@ class MemoryManager:
             logger.error(f"Authentication error: {e}")
             return False, f"Authentication failed: {str(e)}", None
     
+    def invalidate_auth_cache(self, user_id: Optional[str] = None):
+        """Drop cached auth results for one user, or for everyone (e.g. after deactivating users)"""
+        if user_id is None:
+            self._auth_cache.clear()
+        else:
+            self._auth_cache.pop(user_id, None)
+    
     async def is_user_authenticated(self, user_id: str) -> bool:
         """Check if user is authenticated"""
+        expiry = self._auth_cache.get(user_id)
+        if expiry is not None:
+            if expiry > time.monotonic():
+                self._auth_cache.move_to_end(user_id)
+                return True
+            del self._auth_cache[user_id]
+        
         try:
-            conn = sqlite3.connect(self.database_file)
-            cursor = conn.cursor()
-            cursor.execute("SELECT id FROM users WHERE username = ? AND is_active = 1", (user_id,))
-            exists = cursor.fetchone() is not None
-            conn.close()
-            return exists
+            async with self.db.execute(
+                "SELECT EXISTS(SELECT 1 FROM users WHERE username = ? AND is_active = 1)", (user_id,)
+            ) as cursor:
+                (exists,) = await cursor.fetchone()
+            
+            # Only positive results are cached so new registrations are seen immediately
+            if exists:
+                if len(self._auth_cache) >= self.auth_cache_maxsize:
+                    self._auth_cache.popitem(last=False)
+                self._auth_cache[user_id] = time.monotonic() + self.auth_cache_ttl
+            return bool(exists)
         except Exception:
             return False
     
     async def store_interaction(self, user_id: str, user_message: AgentMessage, agent_response: AgentMessage):
-        """Store user interaction"""
+        """Store user interaction, stamped with the response's timestamp"""
         try:
+            now = agent_response.timestamp
             interaction = {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": now.isoformat(),
                 "user_input": user_message.content,
                 "agent_response": agent_response.content,
                 "agent_id": agent_response.agent_id,
                 "actions_taken": agent_response.actions_taken
             }
             
-            self.interaction_history[user_id].append(interaction)
+            # Keeps only the last 50 interactions per user in memory
+            history = await self._get_history(user_id)
+            history.append(interaction)
             
-            # Keep only last 50 interactions per user
-            if len(self.interaction_history[user_id]) > 50:
-                self.interaction_history[user_id] = self.interaction_history[user_id][-50:]
+            # Persisted later by the background flush task
+            await self._write_q.put((
+                user_id, now.timestamp(), user_message.content, agent_response.content,
+                agent_response.agent_id, json_dumps(agent_response.actions_taken)
+            ))
             
             # Update user profile
             if user_id in self.user_profiles:
                 self.user_profiles[user_id].total_interactions += 1
-                self.user_profiles[user_id].last_active = datetime.now()
+                self.user_profiles[user_id].last_active = now
                 
         except Exception as e:
             logger.error(f"Error storing interaction: {e}")
@@ -271,12 +646,21 @@ class MemoryManager:
     async def get_user_memory(self, user_id: str) -> Dict:
         """Get user memory for API"""
         try:
-            recent_interactions = self.interaction_history[user_id][-20:]  # Last 20
+            history = await self._get_history(user_id)
+            newest = history[-1] if history else None
+            
+            # Reuse the snapshot until a new interaction is appended
+            cached = self._memory_cache.get(user_id)
+            if cached is not None and cached[0] is newest:
+                recent_interactions = cached[1]
+            else:
+                recent_interactions = list(islice(history, max(len(history) - 20, 0), None))  # Last 20
+                self._memory_cache[user_id] = (newest, recent_interactions)
             
             return {
                 "recent_interactions": recent_interactions,
                 "memory_stats": {
-                    "total_interactions": len(self.interaction_history[user_id]),
+                    "total_interactions": len(history),
                     "last_active": datetime.now().isoformat()
                 }
             }
@@ -287,6 +671,11 @@ class MemoryManager:
 class GroqAIIntegration:
     """Groq AI integration for general queries that don't match specific agents"""
     
+    # Prompt budget: long context leaves a smaller completion budget
+    LONG_CONTEXT_CHARS = 600
+    MAX_TOKENS = 800
+    MAX_TOKENS_LONG_CONTEXT = 400
+    
     def __init__(self):
         self.client = None
         self.available = False
@@ -312,31 +701,41 @@ class GroqAIIntegration:
             logger.error(f"❌ Groq initialization failed: {e}")
             self.available = False
     
+    async def stream_general_response(self, user_message: str, context: str = "") -> AsyncIterator[str]:
+        """Stream a general response from Groq AI as text chunks as they are generated"""
+        if not self.available:
+            yield "I'm here to help with vehicle controls, navigation, music, and climate. Please ask me something specific about your car!"
+            return
+        
+        # Create context-aware prompt
+        system_prompt = """You are a helpful AI assistant in a smart vehicle. You can have general 
+        conversations, answer questions, and provide helpful information. Be friendly and informative. 
+        Provide complete and useful responses to user queries. Make sure to double check the info you are providing."""
+        
+        user_prompt = f"Context: {context}\n\nUser message: {user_message}"
+        
+        chat_stream = await self.client.chat.completions.create(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            model="llama3-8b-8192",  # Fast model for general conversation
+            max_tokens=self.MAX_TOKENS if len(context) < self.LONG_CONTEXT_CHARS else self.MAX_TOKENS_LONG_CONTEXT,
+            temperature=0.7,
+            stream=True
+        )
+        
+        async for chunk in chat_stream:
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+    
     async def get_general_response(self, user_message: str, context: str = "") -> str:
-        """Get general response from Groq AI"""
+        """Get general response from Groq AI, collected from the stream"""
         try:
-            if not self.available:
-                return "I'm here to help with vehicle controls, navigation, music, and climate. Please ask me something specific about your car!"
-            
-            # Create context-aware prompt
-            system_prompt = """You are a helpful AI assistant in a smart vehicle. You can have general 
-            conversations, answer questions, and provide helpful information. Be friendly and informative. 
-            Provide complete and useful responses to user queries. Make sure to double check the info you are providing."""
-            
-            user_prompt = f"Context: {context}\n\nUser message: {user_message}"
-            
-            chat_completion = await self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                model="llama3-8b-8192",  # Fast model for general conversation
-                max_tokens=800,
-                temperature=0.7
-            )
-            
-            response = chat_completion.choices[0].message.content.strip()
-            logger.info(f"🤖 Groq AI response: {response[:50]}...")
+            chunks = [chunk async for chunk in self.stream_general_response(user_message, context)]
+            response = "".join(chunks).strip()
+            logger.info("🤖 Groq AI response: %.50s...", response)
             return response
             
         except Exception as e:
@@ -392,6 +791,10 @@ class BaseAgent:
         """Handle message - override in specific agents"""
         return "I can help you!", [], {}
 
+def _clip(text: str, limit: int = 200) -> str:
+    """Collapse whitespace and truncate text for the Groq context window"""
+    return " ".join(text.split())[:limit]
+
 class MasterAgent(BaseAgent):
     """Master agent that coordinates other agents and handles Groq AI fallback"""
     
@@ -403,22 +806,21 @@ class MasterAgent(BaseAgent):
     async def process_message(self, message: AgentMessage) -> AgentMessage:
         """Coordinate with specialist agents or use Groq AI fallback"""
         try:
-            # Import here to avoid circular imports
-            from intent_disambiguation import classify_intent
-            
             # Classify intent
             intent_data = classify_intent(message.content)
             
             if not intent_data or intent_data.get('confidence', 0) < 0.3:
                 # No specific intent detected - use Groq AI for general conversation
-                logger.info(f"🤖 No specific intent detected, using Groq AI for: '{message.content}'")
+                logger.info("🤖 No specific intent detected, using Groq AI for: '%s'", message.content)
                 
                 # Get context from recent interactions
                 user_memory = await self.memory_manager.get_user_memory(message.user_id)
                 recent_context = ""
                 if user_memory.get('recent_interactions'):
                     recent = user_memory['recent_interactions'][-3:]  # Last 3 interactions
-                    recent_context = " ".join([f"User: {r['user_input']} Assistant: {r['agent_response']}" for r in recent])
+                    recent_context = " ".join(
+                        f"User: {_clip(r['user_input'])} Assistant: {_clip(r['agent_response'])}" for r in recent
+                    )
                 
                 groq_response = await self.groq_ai.get_general_response(message.content, recent_context)
                 
@@ -437,13 +839,14 @@ class MasterAgent(BaseAgent):
             # Find the best agent for this intent
             target_agent = intent_data.get('target_agent', 'user_experience_agent')
             
-            if target_agent in self.orchestrator.agents:
-                agent_response = await self.orchestrator.agents[target_agent].process_message(message)
-                logger.info(f"🎯 Routed to {target_agent}: {agent_response.content[:50]}...")
-                return agent_response
-            else:
+            agent = self.orchestrator.routing.get(target_agent)
+            if agent is None:
                 # Fallback to master agent handling
                 return await super().process_message(message)
+            
+            agent_response = await agent.process_message(message)
+            logger.info("🎯 Routed to %s: %.50s...", target_agent, agent_response.content)
+            return agent_response
                 
         except Exception as e:
             logger.error(f"Master agent error: {e}")
@@ -470,13 +873,10 @@ class ClimateAgent(BaseAgent):
     
     async def _handle_message(self, message: AgentMessage) -> Tuple[str, List[str], Dict]:
         """Handle climate control requests"""
-        # Import tools here to avoid circular imports
-        from tools import ClimateTools
-        
-        message_lower = message.content.lower()
+        message_lower = message.content_lower
         
         # Temperature control
-        temp_match = re.search(r'(\d+)\s*(?:degrees?|°)', message_lower)
+        temp_match = _TEMP_RE.search(message_lower)
         if temp_match:
             temperature = int(temp_match.group(1))
             result = await ClimateTools.set_temperature(temperature)
@@ -484,18 +884,18 @@ class ClimateAgent(BaseAgent):
                 return result['message'], [f"set_temperature: {temperature}°C"], result.get('vehicle_state', {})
         
         # AC control
-        if any(word in message_lower for word in ['ac', 'air conditioning']):
+        if _CLIMATE_AC_RE.search(message_lower):
             result = await ClimateTools.toggle_ac()
             if result.get('success'):
                 return result['message'], ["toggle_ac"], result.get('vehicle_state', {})
         
         # Temperature adjustment
-        if any(word in message_lower for word in ['hot', 'warm', 'increase', 'up']):
+        if _CLIMATE_WARMER_RE.search(message_lower):
             result = await ClimateTools.set_temperature(25)
             if result.get('success'):
                 return result['message'], ["increase_temperature"], result.get('vehicle_state', {})
         
-        if any(word in message_lower for word in ['cold', 'cool', 'decrease', 'down']):
+        if _CLIMATE_COOLER_RE.search(message_lower):
             result = await ClimateTools.set_temperature(20)
             if result.get('success'):
                 return result['message'], ["decrease_temperature"], result.get('vehicle_state', {})
@@ -514,34 +914,32 @@ class EntertainmentAgent(BaseAgent):
     
     async def _handle_message(self, message: AgentMessage) -> Tuple[str, List[str], Dict]:
         """Handle music and entertainment requests"""
-        from tools import MusicTools
-        
-        message_lower = message.content.lower()
+        message_lower = message.content_lower
         
         # Music playback control - fixed pause detection
-        if any(word in message_lower for word in ['pause', 'stop']) and 'music' in message_lower:
+        if _MUSIC_PAUSE_RE.search(message_lower) and 'music' in message_lower:
             result = await MusicTools.pause_music()
             if result.get('success'):
                 return result['message'], ["pause_music"], result.get('vehicle_state', {})
         
-        elif any(word in message_lower for word in ['play', 'start']) or 'music' in message_lower:
+        elif _MUSIC_PLAY_RE.search(message_lower) or 'music' in message_lower:
             result = await MusicTools.play_music()
             if result.get('success'):
                 return result['message'], ["play_music"], result.get('vehicle_state', {})
         
         # Track navigation
-        if any(word in message_lower for word in ['next', 'skip']):
+        if _MUSIC_NEXT_RE.search(message_lower):
             result = await MusicTools.next_track()
             if result.get('success'):
                 return result['message'], ["next_track"], result.get('vehicle_state', {})
         
-        if any(word in message_lower for word in ['previous', 'back']):
+        if _MUSIC_PREVIOUS_RE.search(message_lower):
             result = await MusicTools.previous_track()
             if result.get('success'):
                 return result['message'], ["previous_track"], result.get('vehicle_state', {})
         
         # Volume control
-        vol_match = re.search(r'volume\s*(?:to\s*)?(\d+)', message_lower)
+        vol_match = _VOL_RE.search(message_lower)
         if vol_match:
             volume = int(vol_match.group(1))
             result = await MusicTools.set_volume(volume)
@@ -562,9 +960,7 @@ class VehicleControlAgent(BaseAgent):
     
     async def _handle_message(self, message: AgentMessage) -> Tuple[str, List[str], Dict]:
         """Handle vehicle control requests"""
-        from tools import VehicleTools
-        
-        message_lower = message.content.lower()
+        message_lower = message.content_lower
         
         # Door control
         if 'lock' in message_lower and 'door' in message_lower:
@@ -578,13 +974,46 @@ class VehicleControlAgent(BaseAgent):
                 return result['message'], ["unlock_doors"], result.get('vehicle_state', {})
         
         # Lights control
-        if any(word in message_lower for word in ['lights', 'headlights']):
+        if _LIGHTS_RE.search(message_lower):
             result = await VehicleTools.toggle_lights()
             if result.get('success'):
                 return result['message'], ["toggle_lights"], result.get('vehicle_state', {})
         
         return "I'll help you control vehicle systems. Try saying 'lock doors', 'unlock doors', or 'turn on lights'.", [], {}
 
+# Navigation fallback replies, picked by _get_helpful_fallback_response
+_FALLBACK_PLACE_WORDS = frozenset({'place', 'where', 'location'})
+_FALLBACK_HELP_WORDS = frozenset({'help', 'can', 'you', 'what'})
+
+_FALLBACK_PLACE = """🗺️ I can help you with navigation and location services! Try asking:
+
+🔍 **Find Places:** "Find restaurants near me" or "Suggest places to visit"
+📍 **Get Location:** "Where am I?" or "What's my current location?"  
+🧭 **Get Directions:** "Navigate to downtown" or "How do I get to the mall?"
+🌤️ **Check Weather:** "What's the weather?" or "How's the weather today?"
+
+What would you like to explore?"""
+
+_FALLBACK_HELP = """🚗 I'm your navigation assistant! Here's what I can do:
+
+🎯 **Tourist Attractions:** "Places to visit in Eluru" or "Tourist attractions nearby"
+🍽️ **Restaurants:** "Find restaurants near me" or "Good places to eat"
+🏨 **Hotels:** "Find hotels nearby" or "Accommodation options"
+🛕 **Temples:** "Nearest temples" or "Religious places nearby"
+🛍️ **Shopping:** "Shopping malls near me" or "Markets nearby"
+⛽ **Services:** "Gas stations nearby" or "Banks near me"
+
+Just tell me what you're looking for!"""
+
+_FALLBACK_DEFAULT = """🗺️ I can help you with navigation and finding places! Try asking about:
+
+• Places to visit and tourist attractions
+• Restaurants, hotels, and services nearby  
+• Directions and navigation to any location
+• Your current location and weather information
+
+What would you like to find or explore?"""
+
 class NavigationAgent(BaseAgent):
     """🔧 ENHANCED: Navigation agent with comprehensive place search and tourist attractions"""
     
@@ -597,48 +1026,34 @@ class NavigationAgent(BaseAgent):
     
     async def _handle_message(self, message: AgentMessage) -> Tuple[str, List[str], Dict]:
         """🔧 ENHANCED: Handle navigation with comprehensive tourist attraction support"""
-        from tools import NavigationTools
-        
-        message_lower = message.content.lower()
+        message_lower = message.content_lower
         user_location = message.user_location
         
         # Extract coordinates if available
         latitude = user_location.get('latitude') if user_location else None
         longitude = user_location.get('longitude') if user_location else None
         
-        logger.info(f"🔧 NavigationAgent processing: '{message_lower}'")
+        logger.info("🔧 NavigationAgent processing: '%s'", message_lower)
         
         # 🔧 ENHANCED: Weather requests with comprehensive patterns
-        if any(pattern in message_lower for pattern in [
-            'weather', 'forecast', 'temperature outside', 'climate outside',
-            'is it raining', 'will it rain', 'sunny', 'cloudy', 'weather report',
-            'current weather', 'weather conditions', 'atmospheric conditions'
-        ]):
+        if _WEATHER_RE.search(message_lower):
             logger.info("🌤️ Processing weather request")
             result = await NavigationTools.get_weather(latitude=latitude, longitude=longitude)
             if result.get('success'):
                 return result['message'], ["get_weather"], {}
         
         # 🔧 ENHANCED: Location requests with better patterns
-        if any(phrase in message_lower for phrase in [
-            'where am i', 'current location', 'my location', 'where are we',
-            'what is my location', 'tell me where i am', 'show location',
-            'gps position', 'coordinates', 'position update'
-        ]):
+        if _LOCATION_RE.search(message_lower):
             logger.info("📍 Processing location request")
             result = await NavigationTools.get_current_location(latitude=latitude, longitude=longitude)
             if result.get('success'):
                 return result['message'], ["get_current_location"], {}
         
         # 🔧 ENHANCED: Place search with comprehensive tourist attraction support
-        if any(word in message_lower for word in [
-            'find', 'search', 'locate', 'look for', 'nearest', 'nearby', 'close',
-            'suggest', 'recommend', 'show me', 'places', 'visit', 'tourist',
-            'attraction', 'sightseeing', 'spots', 'points of interest'
-        ]):
+        if _PLACE_SEARCH_RE.search(message_lower):
             logger.info("🔍 Processing place search request")
             place_type = self._extract_enhanced_place_type(message_lower)
-            logger.info(f"🔧 Extracted place type: '{place_type}' from message: '{message_lower}'")
+            logger.info("🔧 Extracted place type: '%s' from message: '%s'", place_type, message_lower)
             
             result = await NavigationTools.search_nearby_places(place_type, latitude=latitude, longitude=longitude)
             if result.get('success'):
@@ -648,10 +1063,7 @@ class NavigationAgent(BaseAgent):
                 return result['message'], [action_taken], {}
         
         # 🔧 ENHANCED: Directions with better extraction
-        if any(word in message_lower for word in [
-            'navigate', 'directions', 'route', 'go to', 'take me to',
-            'drive to', 'head to', 'guide me to', 'show route to'
-        ]):
+        if _DIRECTIONS_RE.search(message_lower):
             logger.info("🧭 Processing directions request")
             destination = self._extract_destination(message_lower)
             if destination:
@@ -662,156 +1074,60 @@ class NavigationAgent(BaseAgent):
         # 🔧 ENHANCED: Fallback with helpful suggestions
         return self._get_helpful_fallback_response(message_lower), ["navigation_assistance"], {}
     
-    def _extract_enhanced_place_type(self, message: str) -> str:
+    # Pure functions of the message: drivers repeat the same short phrases, so
+    # memoize them (hits skip the per-call debug logging)
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_enhanced_place_type(message_lower: str) -> str:
         """🔧 ENHANCED: Extract place type with comprehensive tourist attraction support"""
-        message_lower = message.lower()
-        
-        # 🔧 FIXED: Hotel/lodging detection (HIGH PRIORITY)
-        hotel_keywords = [
-            'hotel', 'hotels', 'lodging', 'accommodation', 'stay', 'guest house', 
-            'resort', 'resorts', 'inn', 'motel', 'bed and breakfast', 'bnb',
-            'place to stay', 'where to stay', 'accommodation options'
-        ]
-        
-        if any(keyword in message_lower for keyword in hotel_keywords):
-            logger.info("🔧 Detected hotel/lodging request")
-            return 'lodging'
-        
-        # 🔧 ENHANCED: Tourist attractions and sightseeing
-        tourist_keywords = [
-            'visit', 'tourist', 'attraction', 'sightseeing', 'landmark', 'monument',
-            'places to visit', 'tourist attractions', 'sightseeing spots', 'points of interest',
-            'tourist places', 'visiting spots', 'places to see', 'must visit', 'tourist spots',
-            'scenic places', 'beautiful places', 'famous places', 'popular places',
-            'suggest places', 'recommend places', 'interesting places', 'worth visiting'
-        ]
-        
-        if any(keyword in message_lower for keyword in tourist_keywords):
-            logger.info("🔧 Detected tourist attraction request")
-            return 'tourist_attraction'
-        
-        # 🔧 ENHANCED: Religious places
-        if any(word in message_lower for word in ['temple', 'temples', 'church', 'churches', 'mosque', 'mosques', 'worship', 'religious', 'pray', 'prayer', 'shrine']):
-            logger.info("🔧 Detected worship place request")
-            return 'place_of_worship'
-        
-        # 🔧 ENHANCED: Restaurants and food
-        if any(word in message_lower for word in ['restaurant', 'restaurants', 'food', 'eat', 'dine', 'dining', 'meal', 'lunch', 'dinner', 'breakfast']):
-            logger.info("🔧 Detected restaurant request")
-            return 'restaurant'
-        
-        # 🔧 ENHANCED: Shopping
-        if any(word in message_lower for word in ['mall', 'shopping', 'store', 'shop', 'shops', 'market', 'shopping center', 'bazaar', 'retail']):
-            logger.info("🔧 Detected shopping request")
-            return 'shopping_mall'
-        
-        # 🔧 ENHANCED: Medical facilities  
-        if any(word in message_lower for word in ['hospital', 'hospitals', 'medical', 'clinic', 'doctor', 'health', 'pharmacy', 'medical center']):
-            logger.info("🔧 Detected hospital request")
-            return 'hospital'
-        
-        # 🔧 ENHANCED: Coffee and cafes
-        if any(word in message_lower for word in ['coffee', 'cafe', 'cafes', 'coffee shop', 'tea', 'beverages']):
-            logger.info("🔧 Detected cafe request")
-            return 'cafe'
-        
-        # 🔧 ENHANCED: Gas stations
-        if any(word in message_lower for word in ['gas', 'fuel', 'petrol', 'station', 'gas station', 'fuel station']):
-            logger.info("🔧 Detected gas station request")
-            return 'gas_station'
-        
-        # 🔧 ENHANCED: Banks and ATMs
-        if any(word in message_lower for word in ['bank', 'banks', 'atm', 'banking', 'financial']):
-            logger.info("🔧 Detected bank request")
-            return 'bank'
-        
-        # 🔧 ENHANCED: Special handling for general place queries
-        general_place_keywords = ['places', 'spots', 'locations', 'areas', 'somewhere', 'anywhere']
-        if any(keyword in message_lower for keyword in general_place_keywords):
-            # If it's a general place query, default to tourist attractions
-            logger.info("🔧 General places query - defaulting to tourist attractions")
-            return 'tourist_attraction'
+        
+        # One regex pass; the matching group names the rule, lowest index wins
+        best = min((_PLACE_GROUP_RULE[match.lastgroup] for match in _PLACE_RE.finditer(message_lower)), default=None)
+        if best is not None:
+            place_type, log_message, _ = _PLACE_TYPE_RULES[best]
+            logger.info(log_message)
+            return place_type
         
         # Default fallback
         logger.info("🔧 Using default establishment type")
         return 'establishment'
     
-    def _extract_destination(self, message: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _extract_destination(message: str) -> str:
         """🔧 FIXED: Extract destination from navigation request"""
-        patterns = [
-            # FIXED: Proper spacing for optional me/us group
-            r'(?:navigate|directions?|route|guide)\s+(?:(?:me|us)\s+)?to\s+(.+)',
-            r'(?:go|drive|take\s+me|head)\s+to\s+(.+)',
-            r'how\s+(?:do\s+i|can\s+i)\s+get\s+to\s+(.+)',
-            r'(?:show|get|give)\s+(?:me|us)\s+(?:directions?|route)\s+(?:to|for)\s+(.+)',
-            r'(?:plot|plan)\s+(?:a\s+)?(?:course|route)\s+to\s+(.+)',
-            # ADDED: Additional patterns for common variations
-            r'directions?\s+(?:to|for)\s+(.+)',
-            r'route\s+to\s+(.+)',
-            r'where\s+is\s+(.+)',
-            r'find\s+route\s+to\s+(.+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, message, re.IGNORECASE)
-            if match:
-                destination = match.group(1).strip()
-                # Clean up common endings
-                destination = re.sub(r'\s+(please|now|immediately)$', '', destination, flags=re.IGNORECASE)
-                
-                # Debug logging
-                logger.info(f"🎯 Extracted destination: '{destination}' from: '{message}'")
-                return destination
+        match = _DEST_RE.search(message)
+        if match:
+            destination = match.group(match.lastindex).strip()
+            # Clean up common endings
+            destination = _DEST_TRAIL_RE.sub('', destination)
+            
+            # Debug logging
+            logger.info("🎯 Extracted destination: '%s' from: '%s'", destination, message)
+            return destination
         
         # Debug logging for failed extraction
         logger.warning(f"❌ Failed to extract destination from: '{message}'")
         return ""
     
-    def _get_helpful_fallback_response(self, message: str) -> str:
+    def _get_helpful_fallback_response(self, message_lower: str) -> str:
         """🔧 ENHANCED: Provide helpful fallback response with suggestions"""
         
-        # Analyze what the user might have wanted
-        if any(word in message for word in ['place', 'where', 'location']):
-            return """🗺️ I can help you with navigation and location services! Try asking:
-
-🔍 **Find Places:** "Find restaurants near me" or "Suggest places to visit"
-📍 **Get Location:** "Where am I?" or "What's my current location?"  
-🧭 **Get Directions:** "Navigate to downtown" or "How do I get to the mall?"
-🌤️ **Check Weather:** "What's the weather?" or "How's the weather today?"
-
-What would you like to explore?"""
-        
-        elif any(word in message for word in ['help', 'can you', 'what']):
-            return """🚗 I'm your navigation assistant! Here's what I can do:
-
-🎯 **Tourist Attractions:** "Places to visit in Eluru" or "Tourist attractions nearby"
-🍽️ **Restaurants:** "Find restaurants near me" or "Good places to eat"
-🏨 **Hotels:** "Find hotels nearby" or "Accommodation options"
-🛕 **Temples:** "Nearest temples" or "Religious places nearby"
-🛍️ **Shopping:** "Shopping malls near me" or "Markets nearby"
-⛽ **Services:** "Gas stations nearby" or "Banks near me"
-
-Just tell me what you're looking for!"""
-        
-        else:
-            return """🗺️ I can help you with navigation and finding places! Try asking about:
-
-• Places to visit and tourist attractions
-• Restaurants, hotels, and services nearby  
-• Directions and navigation to any location
-• Your current location and weather information
-
-What would you like to find or explore?"""
+        # Tokenize once and pick the reply for what the user might have wanted
+        tokens = set(_WORD_RE.findall(message_lower))
+        if tokens & _FALLBACK_PLACE_WORDS:
+            return _FALLBACK_PLACE
+        if tokens & _FALLBACK_HELP_WORDS:
+            return _FALLBACK_HELP
+        return _FALLBACK_DEFAULT
     
-    def _is_tourist_query(self, message: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _is_tourist_query(message_lower: str) -> bool:
         """Check if this is specifically a tourist/sightseeing query"""
-        tourist_indicators = [
-            'visit', 'tourist', 'attraction', 'sightseeing', 'places to visit',
-            'tourist attractions', 'must visit', 'worth visiting', 'suggest places',
-            'recommend places', 'interesting places', 'beautiful places', 'famous places'
-        ]
-        
-        return any(indicator in message.lower() for indicator in tourist_indicators)
+        if any(_token_in(token, _TOURIST_QUERY_WORDS) for token in _WORD_RE.findall(message_lower)):
+            return True
+        return _TOURIST_QUERY_PHRASE_RE.search(message_lower) is not None
 
 class VehicleInfoAgent(BaseAgent):
     """Vehicle information specialist agent"""
@@ -825,11 +1141,9 @@ class VehicleInfoAgent(BaseAgent):
     
     async def _handle_message(self, message: AgentMessage) -> Tuple[str, List[str], Dict]:
         """Handle vehicle information requests"""
-        from tools import VehicleInfoTools
-        
         # Extract vehicle name and info type
-        vehicle_query = self._extract_vehicle_name(message.content)
-        info_type = self._extract_info_type(message.content)
+        vehicle_query = self._extract_vehicle_name(message.content_lower)
+        info_type = self._extract_info_type(message.content_lower)
         
         result = await VehicleInfoTools.get_vehicle_info(vehicle_query, info_type)
         if result.get('success'):
@@ -837,41 +1151,26 @@ class VehicleInfoAgent(BaseAgent):
         
         return "I can provide information about vehicles like Tesla Model 3, BMW 3 Series, Honda Civic, Ford F-150, and more. What would you like to know?", [], {}
     
-    def _extract_vehicle_name(self, message: str) -> str:
+    def _extract_vehicle_name(self, message_lower: str) -> str:
         """Extract vehicle name from message"""
-        message_lower = message.lower()
-        
-        vehicles = ['tesla model 3', 'bmw 3 series', 'honda civic', 'ford f-150', 'ram 1500', 'toyota tacoma']
-        for vehicle in vehicles:
-            if vehicle in message_lower:
-                return vehicle
-        
-        # Look for individual makes/models
-        if 'tesla' in message_lower:
-            return 'tesla model 3'
-        elif 'bmw' in message_lower:
-            return 'bmw 3 series'
-        elif 'honda' in message_lower:
-            return 'honda civic'
-        elif 'ford' in message_lower:
-            return 'ford f-150'
+        
+        # One pass finds every model/make; full model names outrank bare makes
+        priorities = [_VEHICLE_PRIORITY[match.group(1)] for match in _VEHICLE_SCAN_RE.finditer(message_lower)]
+        if priorities:
+            return _VEHICLE_KEYWORDS[min(priorities)][1]
         
         return 'general'
     
-    def _extract_info_type(self, message: str) -> str:
+    def _extract_info_type(self, message_lower: str) -> str:
         """Extract information type from message"""
-        message_lower = message.lower()
-        
-        if any(word in message_lower for word in ['engine', 'power', 'performance']):
-            return 'engine'
-        elif any(word in message_lower for word in ['features', 'technology']):
-            return 'features'
-        elif any(word in message_lower for word in ['price', 'cost']):
-            return 'price'
-        elif any(word in message_lower for word in ['pros', 'cons']):
-            return 'pros'
-        else:
-            return 'general'
+        
+        # Tokenize once, then take the first rule whose keywords (or their
+        # plurals) appear
+        tokens = set(_WORD_RE.findall(message_lower))
+        for keywords, info_type in _INFO_RULES:
+            if any(_token_in(token, keywords) for token in tokens):
+                return info_type
+        return 'general'
 
 class UserExperienceAgent(BaseAgent):
     """User experience and personalization specialist agent"""
@@ -887,12 +1186,16 @@ class UserExperienceAgent(BaseAgent):
         """Handle general user experience requests"""
         return "I'm here to help you with your vehicle. I can control climate, music, navigation, and vehicle systems. What would you like me to do?", ["general_assistance"], {}
 
+_ORCHESTRATOR_ERROR_REPLY = "I'm experiencing technical difficulties. Please try again."
+
 class AgentOrchestrator:
     """Orchestrates communication between multiple AI agents"""
     
     def __init__(self):
         self.memory_manager = MemoryManager()
         self.agents: Dict[str, BaseAgent] = {}
+        self.routing: Dict[str, BaseAgent] = {}
+        self._master_process = None
         
     async def initialize(self):
         """Initialize all agents and memory"""
@@ -908,25 +1211,36 @@ class AgentOrchestrator:
             "vehicle_info_agent": VehicleInfoAgent(self.memory_manager),
             "user_experience_agent": UserExperienceAgent(self.memory_manager)
         }
+        # Every message enters through the master agent; bind it once
+        self._master_process = self.agents["master_agent"].process_message
+        # Classifier target_agent -> specialist, resolved once; the master is left
+        # out so a master target falls back instead of re-entering itself
+        self.routing = {name: agent for name, agent in self.agents.items() if name != "master_agent"}
         
         logger.info(f"✅ Initialized {len(self.agents)} AI agents with Groq AI fallback")
     
     async def process_message(self, message: AgentMessage) -> AgentMessage:
         """Process message through master agent"""
         try:
-            return await self.agents["master_agent"].process_message(message)
+            return await self._master_process(message)
         except Exception as e:
             logger.error(f"Orchestrator error: {e}")
+            # datetime.now() is the cheapest way to stamp this: fromtimestamp(time.time())
+            # measures slower, and AgentMessage.timestamp must stay a datetime for callers
             return AgentMessage(
-                content="I'm experiencing technical difficulties. Please try again.",
+                content=_ORCHESTRATOR_ERROR_REPLY,
                 user_id=message.user_id,
                 timestamp=datetime.now(),
                 agent_id="orchestrator_error"
             )
     
+    async def shutdown(self):
+        """Release resources held by agents and memory"""
+        await close_http_session()
+        await self.memory_manager.shutdown()
+    
     async def get_vehicle_status(self, user_id: str) -> Dict:
         """Get comprehensive vehicle status"""
-        from tools import get_complete_vehicle_state
         return get_complete_vehicle_state()
     
     def get_memory_manager(self) -> MemoryManager:
@@ -6,7 +6,8 @@ Comprehensive pattern matching with confidence scoring
 
 import re
 import logging
-from typing import Dict, List, Tuple, Optional
+import functools
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -28,291 +29,386 @@ class IntentMatch:
     matched_keywords: List[str]
     target_agent: str
 
-class IntentClassifier:
-    """Comprehensive intent classification with agent routing"""
+# ====================== INTENT TABLES ======================
+# Built once at import and shared by every IntentClassifier
+
+# Comprehensive intent patterns with agent mapping
+_INTENT_PATTERNS: Dict = {
+    # ====================== CLIMATE CONTROL ======================
+    IntentCategory.CLIMATE: {
+        "temperature_control": {
+            "keywords": [
+                "temperature", "temp", "degrees", "celsius", "fahrenheit",
+                "set temperature", "adjust temperature", "change temperature"
+            ],
+            "patterns": [
+                r"(?:set|change|adjust)\s+(?:the\s+)?temperature\s+to\s+(\d+)",
+                r"make\s+it\s+(\d+)\s+degrees",
+                r"temperature\s+(\d+)",
+                r"(\d+)\s*(?:degrees?|°)"
+            ],
+            "confidence": 0.95,
+            "agent": "climate_agent"
+        },
+        "comfort_adjustment": {
+            "keywords": [
+                "hot in here", "cold in here", "warm in here", "cool in here",
+                "too hot", "too cold", "warmer", "cooler", "heat up", "cool down",
+                "stuffy", "chilly", "freezing"
+            ],
+            "exclude_contexts": ["weather", "outside", "forecast", "find", "search", "near"],
+            "confidence": 0.85,
+            "agent": "climate_agent"
+        },
+        "ac_control": {
+            "keywords": [
+                "ac", "air conditioning", "air conditioner", "a/c",
+                "turn on ac", "turn off ac", "toggle ac", "start ac", "stop ac"
+            ],
+            "patterns": [
+                r"turn\s+(?:on|off)\s+(?:the\s+)?(?:ac|air\s+conditioning)",
+                r"(?:start|stop|toggle)\s+(?:the\s+)?ac"
+            ],
+            "confidence": 0.9,
+            "agent": "climate_agent"
+        },
+        "fan_control": {
+            "keywords": [
+                "fan", "fan speed", "ventilation", "airflow", "circulation",
+                "increase fan", "decrease fan", "fan level"
+            ],
+            "confidence": 0.85,
+            "agent": "climate_agent"
+        }
+    },
     
-    def __init__(self):
-        self.intent_patterns = self._build_intent_patterns()
-        self.exclusion_patterns = self._build_exclusion_patterns()
+    # ====================== MUSIC CONTROL ======================
+    IntentCategory.MUSIC: {
+        "playback_control": {
+            "keywords": [
+                "play music", "start music", "play song", "start playing",
+                "resume music", "unpause", "begin music"
+            ],
+            "patterns": [
+                r"play\s+(?:some\s+)?music",
+                r"start\s+(?:playing\s+)?music",
+                r"resume\s+music"
+            ],
+            "confidence": 0.9,
+            "agent": "entertainment_agent"
+        },
+        "pause_stop": {
+            "keywords": [
+                "pause music", "stop music", "pause", "stop", "halt music",
+                "stop playing", "pause the music", "cease music"
+            ],
+            "patterns": [
+                r"(?:pause|stop)\s+(?:the\s+)?music",
+                r"(?:pause|stop)\s+playing"
+            ],
+            "confidence": 0.95,
+            "agent": "entertainment_agent"
+        },
+        "track_navigation": {
+            "keywords": [
+                "next song", "next track", "skip song", "skip track", "skip",
+                "previous song", "previous track", "back", "last track",
+                "go back", "skip forward", "skip backward"
+            ],
+            "patterns": [
+                r"(?:next|skip)\s+(?:song|track)",
+                r"(?:previous|back|last)\s+(?:song|track)",
+                r"go\s+back"
+            ],
+            "confidence": 0.9,
+            "agent": "entertainment_agent"
+        },
+        "volume_control": {
+            "keywords": [
+                "volume", "loud", "louder", "quiet", "quieter", "soft",
+                "turn up", "turn down", "increase volume", "decrease volume",
+                "mute", "unmute", "sound level"
+            ],
+            "patterns": [
+                r"(?:set|change)\s+(?:the\s+)?volume\s+to\s+(\d+)",
+                r"volume\s+(\d+)",
+                r"make\s+it\s+(?:louder|quieter|loud|quiet)"
+            ],
+            "confidence": 0.9,
+            "agent": "entertainment_agent"
+        }
+    },
     
-    def _build_intent_patterns(self) -> Dict:
-        """Build comprehensive intent patterns with agent mapping"""
-        return {
-            # ====================== CLIMATE CONTROL ======================
-            IntentCategory.CLIMATE: {
-                "temperature_control": {
-                    "keywords": [
-                        "temperature", "temp", "degrees", "celsius", "fahrenheit",
-                        "set temperature", "adjust temperature", "change temperature"
-                    ],
-                    "patterns": [
-                        r"(?:set|change|adjust)\s+(?:the\s+)?temperature\s+to\s+(\d+)",
-                        r"make\s+it\s+(\d+)\s+degrees",
-                        r"temperature\s+(\d+)",
-                        r"(\d+)\s*(?:degrees?|°)"
-                    ],
-                    "confidence": 0.95,
-                    "agent": "climate_agent"
-                },
-                "comfort_adjustment": {
-                    "keywords": [
-                        "hot in here", "cold in here", "warm in here", "cool in here",
-                        "too hot", "too cold", "warmer", "cooler", "heat up", "cool down",
-                        "stuffy", "chilly", "freezing"
-                    ],
-                    "exclude_contexts": ["weather", "outside", "forecast", "find", "search", "near"],
-                    "confidence": 0.85,
-                    "agent": "climate_agent"
-                },
-                "ac_control": {
-                    "keywords": [
-                        "ac", "air conditioning", "air conditioner", "a/c",
-                        "turn on ac", "turn off ac", "toggle ac", "start ac", "stop ac"
-                    ],
-                    "patterns": [
-                        r"turn\s+(?:on|off)\s+(?:the\s+)?(?:ac|air\s+conditioning)",
-                        r"(?:start|stop|toggle)\s+(?:the\s+)?ac"
-                    ],
-                    "confidence": 0.9,
-                    "agent": "climate_agent"
-                },
-                "fan_control": {
-                    "keywords": [
-                        "fan", "fan speed", "ventilation", "airflow", "circulation",
-                        "increase fan", "decrease fan", "fan level"
-                    ],
-                    "confidence": 0.85,
-                    "agent": "climate_agent"
-                }
-            },
-            
-            # ====================== MUSIC CONTROL ======================
-            IntentCategory.MUSIC: {
-                "playback_control": {
-                    "keywords": [
-                        "play music", "start music", "play song", "start playing",
-                        "resume music", "unpause", "begin music"
-                    ],
-                    "patterns": [
-                        r"play\s+(?:some\s+)?music",
-                        r"start\s+(?:playing\s+)?music",
-                        r"resume\s+music"
-                    ],
-                    "confidence": 0.9,
-                    "agent": "entertainment_agent"
-                },
-                "pause_stop": {
-                    "keywords": [
-                        "pause music", "stop music", "pause", "stop", "halt music",
-                        "stop playing", "pause the music", "cease music"
-                    ],
-                    "patterns": [
-                        r"(?:pause|stop)\s+(?:the\s+)?music",
-                        r"(?:pause|stop)\s+playing"
-                    ],
-                    "confidence": 0.95,
-                    "agent": "entertainment_agent"
-                },
-                "track_navigation": {
-                    "keywords": [
-                        "next song", "next track", "skip song", "skip track", "skip",
-                        "previous song", "previous track", "back", "last track",
-                        "go back", "skip forward", "skip backward"
-                    ],
-                    "patterns": [
-                        r"(?:next|skip)\s+(?:song|track)",
-                        r"(?:previous|back|last)\s+(?:song|track)",
-                        r"go\s+back"
-                    ],
-                    "confidence": 0.9,
-                    "agent": "entertainment_agent"
-                },
-                "volume_control": {
-                    "keywords": [
-                        "volume", "loud", "louder", "quiet", "quieter", "soft",
-                        "turn up", "turn down", "increase volume", "decrease volume",
-                        "mute", "unmute", "sound level"
-                    ],
-                    "patterns": [
-                        r"(?:set|change)\s+(?:the\s+)?volume\s+to\s+(\d+)",
-                        r"volume\s+(\d+)",
-                        r"make\s+it\s+(?:louder|quieter|loud|quiet)"
-                    ],
-                    "confidence": 0.9,
-                    "agent": "entertainment_agent"
-                }
-            },
-            
-            # ====================== VEHICLE CONTROL ======================
-            IntentCategory.VEHICLE_CONTROL: {
-                "door_control": {
-                    "keywords": [
-                        "lock doors", "unlock doors", "lock the doors", "unlock the doors",
-                        "door locks", "secure doors", "open doors", "close doors"
-                    ],
-                    "patterns": [
-                        r"(?:lock|unlock)\s+(?:the\s+)?doors?",
-                        r"(?:secure|open)\s+(?:the\s+)?(?:car|vehicle)"
-                    ],
-                    "confidence": 0.95,
-                    "agent": "vehicle_control_agent"
-                },
-                "lights_control": {
-                    "keywords": [
-                        "lights", "headlights", "headlamps", "turn on lights", "turn off lights",
-                        "toggle lights", "vehicle lights", "car lights"
-                    ],
-                    "patterns": [
-                        r"turn\s+(?:on|off)\s+(?:the\s+)?(?:lights?|headlights?)",
-                        r"toggle\s+(?:the\s+)?lights?"
-                    ],
-                    "confidence": 0.9,
-                    "agent": "vehicle_control_agent"
-                }
-            },
-            
-            # ====================== NAVIGATION ======================
-            IntentCategory.NAVIGATION: {
-                "location_query": {
-                    "keywords": [
-                        "where am i", "current location", "my location", "where are we",
-                        "what is my location", "tell me where i am", "location"
-                    ],
-                    "patterns": [
-                        r"where\s+am\s+i",
-                        r"(?:current|my)\s+location",
-                        r"where\s+are\s+we"
-                    ],
-                    "confidence": 0.95,
-                    "agent": "navigation_agent"
-                },
-                "directions": {
-                    "keywords": [
-                        "navigate", "directions", "route", "go to", "take me to",
-                        "drive to", "head to", "how to get to", "way to", "path to"
-                    ],
-                    "patterns": [
-                        r"(?:navigate|directions?)\s+to\s+(.+)",
-                        r"(?:go|drive|take\s+me)\s+to\s+(.+)",
-                        r"how\s+(?:do\s+i|can\s+i)\s+get\s+to\s+(.+)"
-                    ],
-                    "confidence": 0.9,
-                    "agent": "navigation_agent"
-                },
-                "place_search": {
-                    "keywords": [
-                        "find", "search", "locate", "look for", "where is", "nearest",
-                        "nearby", "close", "around", "near me", "temple", "restaurant",
-                        "hospital", "gas station", "coffee", "mall", "shopping",
-                        # 🔧 ADD THESE HOTEL KEYWORDS:
-                        "hotel", "hotels", "accommodation", "lodging", "stay", "guest house", "resort"
-                    ],
-                    "patterns": [
-                        r"find\s+(.+)\s+near\s+me",
-                        r"(?:where\s+is|find|locate)\s+(?:the\s+)?nearest\s+(.+)",
-                        r"search\s+for\s+(.+)",
-                        r"look\s+for\s+(.+)\s+(?:nearby|around|close)",
-                        # 🔧 ADD THESE HOTEL PATTERNS:
-                        r"find\s+(?:hotels?|accommodation|lodging)",
-                        r"(?:hotels?|accommodation)\s+(?:in|near|around)",
-                        r"where\s+(?:can\s+i|to)\s+stay"
-                    ],
-                    "confidence": 0.9,
-                    "agent": "navigation_agent"
-                },
-                
+    # ====================== VEHICLE CONTROL ======================
+    IntentCategory.VEHICLE_CONTROL: {
+        "door_control": {
+            "keywords": [
+                "lock doors", "unlock doors", "lock the doors", "unlock the doors",
+                "door locks", "secure doors", "open doors", "close doors"
+            ],
+            "patterns": [
+                r"(?:lock|unlock)\s+(?:the\s+)?doors?",
+                r"(?:secure|open)\s+(?:the\s+)?(?:car|vehicle)"
+            ],
+            "confidence": 0.95,
+            "agent": "vehicle_control_agent"
+        },
+        "lights_control": {
+            "keywords": [
+                "lights", "headlights", "headlamps", "turn on lights", "turn off lights",
+                "toggle lights", "vehicle lights", "car lights"
+            ],
+            "patterns": [
+                r"turn\s+(?:on|off)\s+(?:the\s+)?(?:lights?|headlights?)",
+                r"toggle\s+(?:the\s+)?lights?"
+            ],
+            "confidence": 0.9,
+            "agent": "vehicle_control_agent"
+        }
+    },
+    
+    # ====================== NAVIGATION ======================
+    IntentCategory.NAVIGATION: {
+        "location_query": {
+            "keywords": [
+                "where am i", "current location", "my location", "where are we",
+                "what is my location", "tell me where i am", "location"
+            ],
+            "patterns": [
+                r"where\s+am\s+i",
+                r"(?:current|my)\s+location",
+                r"where\s+are\s+we"
+            ],
+            "confidence": 0.95,
+            "agent": "navigation_agent"
+        },
+        "directions": {
+            "keywords": [
+                "navigate", "directions", "route", "go to", "take me to",
+                "drive to", "head to", "how to get to", "way to", "path to"
+            ],
+            "patterns": [
+                r"(?:navigate|directions?)\s+to\s+(.+)",
+                r"(?:go|drive|take\s+me)\s+to\s+(.+)",
+                r"how\s+(?:do\s+i|can\s+i)\s+get\s+to\s+(.+)"
+            ],
+            "confidence": 0.9,
+            "agent": "navigation_agent"
+        },
+        "place_search": {
+            "keywords": [
+                "find", "search", "locate", "look for", "where is", "nearest",
+                "nearby", "close", "around", "near me", "temple", "restaurant",
+                "hospital", "gas station", "coffee", "mall", "shopping",
+                # 🔧 ADD THESE HOTEL KEYWORDS:
+                "hotel", "hotels", "accommodation", "lodging", "stay", "guest house", "resort"
+            ],
+            "patterns": [
+                r"find\s+(.+)\s+near\s+me",
+                r"(?:where\s+is|find|locate)\s+(?:the\s+)?nearest\s+(.+)",
+                r"search\s+for\s+(.+)",
+                r"look\s+for\s+(.+)\s+(?:nearby|around|close)",
+                # 🔧 ADD THESE HOTEL PATTERNS:
+                r"find\s+(?:hotels?|accommodation|lodging)",
+                r"(?:hotels?|accommodation)\s+(?:in|near|around)",
+                r"where\s+(?:can\s+i|to)\s+stay"
+            ],
+            "confidence": 0.9,
+            "agent": "navigation_agent"
+        },
+        
 
-                "weather": {
-                    "keywords": [
-                        "weather", "how is the weather", "what's the weather", "weather like",
-                        "current weather", "weather conditions"
-                    ],
-                    "patterns": [
-                        r"(?:what.?s|how.?s)\s+the\s+weather",
-                        r"how\s+is\s+the\s+weather"
-                    ],
-                    "confidence": 0.95,  # Higher confidence for weather
-                    "agent": "navigation_agent"
-                }
-            },
-            
-            # ====================== VEHICLE INFORMATION ======================
-            IntentCategory.VEHICLE_INFO: {
-                "vehicle_inquiry": {
-                    "keywords": [
-                        "tell me about", "information about", "details about", "specs",
-                        "specifications", "features", "what is", "describe", "explain",
-                        "tesla", "bmw", "honda", "ford", "model 3", "civic", "f-150"
-                    ],
-                    "patterns": [
-                        r"tell\s+me\s+about\s+(?:the\s+)?(.+)",
-                        r"(?:what|how)\s+(?:is|are)\s+(?:the\s+)?(.+)",
-                        r"(?:info|information|details)\s+(?:about|on)\s+(.+)",
-                        r"(?:specs|features)\s+of\s+(?:the\s+)?(.+)"
-                    ],
-                    "confidence": 0.8,
-                    "agent": "vehicle_info_agent"
-                }
-            },
-            
-            # ====================== GENERAL CONVERSATION ======================
-            IntentCategory.GENERAL_CONVERSATION: {
-                "greetings": {
-                    "keywords": [
-                        "hello", "hi", "hey", "good morning", "good afternoon",
-                        "good evening", "good night", "greetings", "howdy"
-                    ],
-                    "confidence": 0.9,
-                    "agent": "user_experience_agent"
-                },
-                "general_chat": {
-                    "keywords": [
-                        "how are you", "what can you do", "help me", "assist me",
-                        "what's up", "thank you", "thanks", "appreciate"
-                    ],
-                    "confidence": 0.7,
-                    "agent": "user_experience_agent"
-                }
-            }
+        "weather": {
+            "keywords": [
+                "weather", "how is the weather", "what's the weather", "weather like",
+                "current weather", "weather conditions"
+            ],
+            "patterns": [
+                r"(?:what.?s|how.?s)\s+the\s+weather",
+                r"how\s+is\s+the\s+weather"
+            ],
+            "confidence": 0.95,  # Higher confidence for weather
+            "agent": "navigation_agent"
         }
+    },
     
-    def _build_exclusion_patterns(self) -> Dict:
-        """Build exclusion patterns to prevent false matches"""
-        return {
-            IntentCategory.CLIMATE: {
-                # Don't trigger climate for weather/navigation queries
-                "weather_context": ["weather", "outside", "forecast", "atmospheric"],
-                "location_context": ["find", "search", "locate", "near", "place", "hotel", "restaurant"]
-            }
+    # ====================== VEHICLE INFORMATION ======================
+    IntentCategory.VEHICLE_INFO: {
+        "vehicle_inquiry": {
+            "keywords": [
+                "tell me about", "information about", "details about", "specs",
+                "specifications", "features", "what is", "describe", "explain",
+                "tesla", "bmw", "honda", "ford", "model 3", "civic", "f-150"
+            ],
+            "patterns": [
+                r"tell\s+me\s+about\s+(?:the\s+)?(.+)",
+                r"(?:what|how)\s+(?:is|are)\s+(?:the\s+)?(.+)",
+                r"(?:info|information|details)\s+(?:about|on)\s+(.+)",
+                r"(?:specs|features)\s+of\s+(?:the\s+)?(.+)"
+            ],
+            "confidence": 0.8,
+            "agent": "vehicle_info_agent"
         }
+    },
+    
+    # ====================== GENERAL CONVERSATION ======================
+    IntentCategory.GENERAL_CONVERSATION: {
+        "greetings": {
+            "keywords": [
+                "hello", "hi", "hey", "good morning", "good afternoon",
+                "good evening", "good night", "greetings", "howdy"
+            ],
+            "confidence": 0.9,
+            "agent": "user_experience_agent"
+        },
+        "general_chat": {
+            "keywords": [
+                "how are you", "what can you do", "help me", "assist me",
+                "what's up", "thank you", "thanks", "appreciate"
+            ],
+            "confidence": 0.7,
+            "agent": "user_experience_agent"
+        }
+    }
+}
+
+# Exclusion patterns to prevent false matches
+_EXCLUSION_PATTERNS: Dict = {
+    IntentCategory.CLIMATE: {
+        # Don't trigger climate for weather/navigation queries
+        "weather_context": ["weather", "outside", "forecast", "atmospheric"],
+        "location_context": ["find", "search", "locate", "near", "place", "hotel", "restaurant"]
+    }
+}
+
+@dataclass(slots=True)
+class _SubcategoryConfig:
+    """Scoring view of one subcategory config, flattened for attribute access"""
+    base_confidence: float
+    keyword_weights: List[Tuple[str, float]]
+    pattern_union: Optional[re.Pattern]
+    exclude_contexts: List[str]
+    exclude_context_set: frozenset
+    category_exclusions: Optional[frozenset]
+    agent: str
+
+def _compile_intent_tables(intent_patterns: Dict, exclusion_patterns: Dict) -> Tuple:
+    """Build the shared scan tables and per-subcategory scoring configs"""
+    # Compile every subcategory's patterns once instead of per message, and
+    # resolve its category's exclusions so scoring skips the Enum-keyed lookup.
+    # Any excluded word applies the same penalty, so each table is one set.
+    # The result is a flat (category, subcategory, config) list in declaration order.
+    subcategory_list = []
+    for category, subcategories in intent_patterns.items():
+        exclusions = exclusion_patterns.get(category)
+        exclusion_words = None if exclusions is None else frozenset(
+            word for words in exclusions.values() for word in words
+        )
+        for subcategory, config in subcategories.items():
+            # Any one pattern scores the same, so search their union once.
+            # Patterns are lowercase and only ever see the lowercased
+            # message, so no IGNORECASE (it case-folds every comparison).
+            pattern_union = None
+            if "patterns" in config:
+                pattern_union = re.compile("|".join(f"(?:{p})" for p in config["patterns"]))
+            exclude_contexts = config.get("exclude_contexts", [])
+            subcategory_list.append((category, subcategory, _SubcategoryConfig(
+                base_confidence=config.get("confidence", 0.5),
+                # Multi-word keywords get higher score
+                keyword_weights=[
+                    (keyword, 0.4 if len(keyword.split()) > 1 else 0.2) for keyword in config["keywords"]
+                ],
+                pattern_union=pattern_union,
+                exclude_contexts=exclude_contexts,
+                exclude_context_set=frozenset(exclude_contexts),
+                category_exclusions=exclusion_words,
+                agent=config["agent"],
+            )))
+    
+    # Union of every subcategory's patterns: when it finds nothing (most chat
+    # messages) the per-subcategory searches are skipped. It cannot replace
+    # them, since overlapping alternatives at one position report only once.
+    pattern_prefilter = re.compile("|".join(
+        f"(?:{p})"
+        for subcategories in intent_patterns.values()
+        for config in subcategories.values()
+        for p in config.get("patterns", ())
+    ))
+    
+    # One scan finds every keyword and exclusion term in the message. At each
+    # position the lookahead reports the longest term starting there; any
+    # shorter term starting at the same position is a prefix of it.
+    all_terms = set()
+    all_keywords = set()
+    for subcategories in intent_patterns.values():
+        for config in subcategories.values():
+            all_keywords.update(config["keywords"])
+            all_terms.update(config.get("exclude_contexts", ()))
+    all_terms.update(all_keywords)
+    for exclusions in exclusion_patterns.values():
+        for exclusion_words in exclusions.values():
+            all_terms.update(exclusion_words)
+    term_scan = re.compile("(?=(" + "|".join(
+        re.escape(term) for term in sorted(all_terms, key=len, reverse=True)
+    ) + "))")
+    term_prefixes = {
+        term: [other for other in all_terms if term.startswith(other)]
+        for term in all_terms
+    }
+    return subcategory_list, pattern_prefilter, frozenset(all_keywords), term_scan, term_prefixes
+
+(_SUBCATEGORIES, _PATTERN_PREFILTER, _ALL_KEYWORDS,
+ _TERM_SCAN, _TERM_PREFIXES) = _compile_intent_tables(_INTENT_PATTERNS, _EXCLUSION_PATTERNS)
+
+class IntentClassifier:
+    """Comprehensive intent classification with agent routing"""
+    
+    def __init__(self):
+        self.intent_patterns = _INTENT_PATTERNS
+        self.exclusion_patterns = _EXCLUSION_PATTERNS
+        self._subcategories = _SUBCATEGORIES
+        self._pattern_prefilter = _PATTERN_PREFILTER
+        self._all_keywords = _ALL_KEYWORDS
+        self._term_scan = _TERM_SCAN
+        self._term_prefixes = _TERM_PREFIXES
+        
+        # Voice commands repeat a lot; memoize the finished result dict on the
+        # normalized message. Cached dicts are never handed out, callers get a copy.
+        self._classify_cached = functools.lru_cache(maxsize=4096)(self._build_result)
     
     def classify_intent(self, message: str) -> Dict:
         """Main intent classification function"""
-        message_lower = message.lower().strip()
+        cached = self._classify_cached(message.lower().strip())
         
-        # Find all potential matches
-        all_matches = []
+        if cached["confidence"] > 0:
+            logger.info("🎯 Intent: %s/%s (confidence: %.2f) -> %s", cached["primary_intent"],
+                        cached["subcategory"], cached["confidence"], cached["target_agent"])
         
-        for category, subcategories in self.intent_patterns.items():
-            for subcategory, config in subcategories.items():
-                confidence = self._calculate_confidence(message_lower, config, category)
-                
-                if confidence > 0:
-                    matched_keywords = self._get_matched_keywords(message_lower, config)
-                    
-                    match = IntentMatch(
-                        category=category,
-                        subcategory=subcategory,
-                        confidence=confidence,
-                        matched_keywords=matched_keywords,
-                        target_agent=config["agent"]
-                    )
-                    all_matches.append(match)
-        
-        # Sort by confidence and select best match
-        all_matches.sort(key=lambda x: x.confidence, reverse=True)
+        # A shallow copy is one C-level dict copy; only the list is mutable
+        result = dict(cached)
+        result["matched_keywords"] = list(cached["matched_keywords"])
+        return result
+    
+    def classify_batch(self, messages: List[str]) -> List[Dict]:
+        """Classify many messages (e.g. transcript backlogs), scoring each distinct one once"""
+        # A local table instead of the LRU, so a bulk run doesn't evict live commands
+        distinct: Dict[str, Dict] = {}
+        results = []
+        for message in messages:
+            message_lower = message.lower().strip()
+            cached = distinct.get(message_lower)
+            if cached is None:
+                cached = distinct[message_lower] = self._build_result(message_lower)
+            result = dict(cached)
+            result["matched_keywords"] = list(cached["matched_keywords"])
+            results.append(result)
+        return results
+    
+    def _build_result(self, message_lower: str) -> Dict:
+        """Classify a normalized message into the public result dict"""
+        best_match = self._classify(message_lower)
         
-        if not all_matches or all_matches[0].confidence < 0.3:
+        if best_match is None:
             # No clear intent - trigger Groq AI fallback
             return {
                 "primary_intent": "general_conversation",
@@ -323,11 +419,6 @@ class IntentClassifier:
                 "explanation": "No specific intent detected, using general conversation"
             }
         
-        best_match = all_matches[0]
-        
-        logger.info(f"🎯 Intent: {best_match.category.value}/{best_match.subcategory} "
-                   f"(confidence: {best_match.confidence:.2f}) -> {best_match.target_agent}")
-        
         return {
             "primary_intent": best_match.category.value,
             "subcategory": best_match.subcategory,
@@ -337,60 +428,85 @@ class IntentClassifier:
             "explanation": f"Detected {best_match.category.value} intent with {best_match.confidence:.1%} confidence"
         }
     
-    def _calculate_confidence(self, message: str, config: Dict, category: IntentCategory) -> float:
-        """Calculate confidence score for intent match"""
-        base_confidence = config.get("confidence", 0.5)
+    def _classify(self, message_lower: str) -> Optional[IntentMatch]:
+        """Return the best intent match for a normalized message, or None below threshold"""
+        # Keep the first highest-confidence match; confidence is capped at 1.0,
+        # so a perfect score cannot be beaten and ends the scan early. The best
+        # candidate is tracked as a plain tuple and only the winner becomes an
+        # IntentMatch.
+        best_confidence, best = 0.0, None
+        found = self._scan_terms(message_lower)
+        any_pattern = self._pattern_prefilter.search(message_lower) is not None
+        if not any_pattern and found.isdisjoint(self._all_keywords):
+            return None  # Nothing can score: no keyword and no pattern hit
+        
+        for category, subcategory, config in self._subcategories:
+            confidence, matched_keywords = self._calculate_confidence(message_lower, config, category, found, any_pattern)
+            
+            if confidence > best_confidence:
+                best_confidence, best = confidence, (category, subcategory, matched_keywords, config.agent)
+                if confidence >= 1.0:
+                    break
+        
+        if best_confidence < 0.3:
+            return None
+        category, subcategory, matched_keywords, target_agent = best
+        return IntentMatch(
+            category=category,
+            subcategory=subcategory,
+            confidence=best_confidence,
+            matched_keywords=matched_keywords,
+            target_agent=target_agent
+        )
+    
+    def _scan_terms(self, message: str) -> Set[str]:
+        """Return every keyword or exclusion term contained in the message"""
+        found: Set[str] = set()
+        for match in self._term_scan.finditer(message):
+            found.update(self._term_prefixes[match.group(1)])
+        return found
+    
+    def _calculate_confidence(self, message: str, config: _SubcategoryConfig, category: IntentCategory,
+                              found: Set[str], any_pattern: bool = True) -> Tuple[float, List[str]]:
+        """Calculate confidence score for intent match, with the keywords that matched"""
+        base_confidence = config.base_confidence
         score = 0.0
         
         # Check keyword matches
-        keyword_score = 0
-        for keyword in config["keywords"]:
-            if keyword in message:
-                # Multi-word keywords get higher score
-                keyword_score += 0.4 if len(keyword.split()) > 1 else 0.2
+        keyword_score = 0.0
+        matched: List[str] = []
+        for keyword, weight in config.keyword_weights:
+            if keyword in found:
+                matched.append(keyword)
+                keyword_score += weight
         
         # Check pattern matches
-        pattern_score = 0
-        if "patterns" in config:
-            for pattern in config["patterns"]:
-                if re.search(pattern, message, re.IGNORECASE):
-                    pattern_score += 0.5
-                    break  # Only count one pattern match
+        pattern_score = 0.0
+        pattern_union = config.pattern_union
+        if any_pattern and pattern_union is not None and pattern_union.search(message):
+            pattern_score = 0.5  # Only count one pattern match
         
         # Combine scores
         score = keyword_score + pattern_score
         
         # Apply exclusions
-        if category in self.exclusion_patterns:
-            exclusions = self.exclusion_patterns[category]
-            
+        exclusion_words = config.category_exclusions
+        if exclusion_words is not None:
             # Check specific exclusions for this subcategory
-            if "exclude_contexts" in config:
-                for exclude_context in config["exclude_contexts"]:
-                    if exclude_context in message:
-                        score *= 0.1  # Heavily penalize excluded contexts
-                        logger.info(f"🚫 Reducing score for {category.value} due to exclusion: {exclude_context}")
-                        break
+            if not found.isdisjoint(config.exclude_context_set):
+                score *= 0.1  # Heavily penalize excluded contexts
+                exclude_context = next(term for term in config.exclude_contexts if term in found)
+                logger.info("🚫 Reducing score for %s due to exclusion: %s", category.value, exclude_context)
             
             # Check general category exclusions
-            for exclusion_type, exclusion_words in exclusions.items():
-                if any(word in message for word in exclusion_words):
-                    score *= 0.3  # Moderate penalty for general exclusions
-                    break
+            if not found.isdisjoint(exclusion_words):
+                score *= 0.3  # Moderate penalty for general exclusions
         
         # Scale by base confidence
         final_score = min(score * base_confidence, 1.0)
         
         # Minimum threshold
-        return final_score if final_score > 0.15 else 0.0
-    
-    def _get_matched_keywords(self, message: str, config: Dict) -> List[str]:
-        """Get list of keywords that matched in the message"""
-        matched = []
-        for keyword in config["keywords"]:
-            if keyword in message:
-                matched.append(keyword)
-        return matched
+        return (final_score if final_score > 0.15 else 0.0), matched
 
 # Global classifier instance
 _classifier = IntentClassifier()
@@ -399,6 +515,10 @@ def classify_intent(message: str) -> Dict:
     """Main function to classify user intent"""
     return _classifier.classify_intent(message)
 
+def classify_intents(messages: List[str]) -> List[Dict]:
+    """Classify a batch of messages, same result shape as classify_intent"""
+    return _classifier.classify_batch(messages)
+
 def explain_intent_classification(message: str) -> str:
     """Get detailed explanation of intent classification"""
     result = classify_intent(message)
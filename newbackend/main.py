@@ -5,41 +5,79 @@ Maintains exact API contracts for seamless frontend-backend integration
 """
 
 import asyncio
-import json
+import atexit
+import importlib.util
 import logging
+import logging.handlers
 import os
+import queue
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 import uvicorn
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, UploadFile, File, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
-from pydantic import BaseModel
-import tempfile
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ConfigDict
+
+# uvloop gives a faster event loop for the many small agent coroutines
+# (uvicorn imports it itself; only its presence matters here)
+UVLOOP_AVAILABLE = importlib.util.find_spec("uvloop") is not None
+
+# httptools parses HTTP in C instead of uvicorn's pure-Python h11 fallback
+HTTPTOOLS_AVAILABLE = importlib.util.find_spec("httptools") is not None
+
+# orjson renders REST responses several times faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Load environment variables
 from dotenv import load_dotenv
 load_dotenv()
 
+# API keys don't change after start; read them once instead of per request
+GOOGLE_MAPS_CONFIGURED = bool(os.getenv("GOOGLE_MAPS_API_KEY"))
+WEATHER_CONFIGURED = bool(os.getenv("OPENWEATHER_API_KEY"))
+GROQ_CONFIGURED = bool(os.getenv("GROQ_API_KEY"))
+# Opt-in extra classifier pass per voice request, for routing debugging only
+DEBUG_INTENT = os.getenv("DEBUG_INTENT") == "1"
+
 # Import our modules
-from agents import AgentOrchestrator, AgentMessage, MemoryManager
-from tools import get_complete_vehicle_state
+from agents import AgentOrchestrator, AgentMessage, MemoryManager, json_dumps, json_loads
+from tools import NavigationTools, get_complete_vehicle_state, start_mixer_warmup
 from intent_disambiguation import classify_intent
 
 # Ensure directories exist FIRST
 os.makedirs("logs", exist_ok=True)
 os.makedirs("data", exist_ok=True)
 
-# Configure logging AFTER directory creation
+# Configure logging AFTER directory creation. Log calls only enqueue the
+# formatted record; a listener thread does the file and console writes so the
+# event loop never blocks on disk I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('logs/assistant.log'),
+    logging.StreamHandler()
+)
+# Runs for the whole process, not per app lifespan: stopping it in a shutdown
+# handler would strand every later record in the queue. atexit flushes it
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('logs/assistant.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
 logger = logging.getLogger(__name__)
+if DEBUG_INTENT:
+    # basicConfig pins INFO; the intent debug line needs this logger at DEBUG
+    logger.setLevel(logging.DEBUG)
+
+# Bound once so the per-message paths skip the attribute lookup
+_now = datetime.now
 
 # ====================== PYDANTIC MODELS ======================
 
@@ -48,18 +86,17 @@ class VoiceRequest(BaseModel):
     user_id: str = "default_user"
     user_location: Optional[Dict] = None
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "text": "Find restaurants near me",
-                "user_id": "john_doe", 
-                "user_location": {
-                    "latitude": 13.0827,
-                    "longitude": 80.2707,
-                    "is_fallback": False
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "text": "Find restaurants near me",
+            "user_id": "john_doe", 
+            "user_location": {
+                "latitude": 13.0827,
+                "longitude": 80.2707,
+                "is_fallback": False
             }
         }
+    })
 
 class VehicleCommand(BaseModel):
     command: str
@@ -91,26 +128,35 @@ class AuthResponse(BaseModel):
 
 # ====================== FASTAPI APPLICATION ======================
 
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder"""
+    
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
 app = FastAPI(
     title="Agentic AI In-Vehicle Assistant",
     description="Multi-agent AI system with Groq AI integration for personalized vehicle control",
-    version="3.0.0"
+    version="3.0.0",
+    default_response_class=ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
 )
 
 # Enable CORS for frontend integration
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000", "*"],
+    # Explicit lists: "*" alongside credentials makes the middleware reflect
+    # every origin and header, and browsers reject wildcard credentialed CORS
+    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
 # ====================== GLOBAL VARIABLES ======================
 
 agent_orchestrator: Optional[AgentOrchestrator] = None
 memory_manager: Optional[MemoryManager] = None
-active_connections: List[WebSocket] = []
+active_connections: Set[WebSocket] = set()
 
 # ====================== STARTUP/SHUTDOWN ======================
 
@@ -120,15 +166,15 @@ async def startup_event():
     global agent_orchestrator, memory_manager
     
     logger.info("🚀 Starting Agentic AI In-Vehicle Assistant v3.0...")
+    logger.info(f"⚡ Event loop: {type(asyncio.get_running_loop()).__module__}")
     
     # Log API configuration
-    google_key = os.getenv("GOOGLE_MAPS_API_KEY")
-    weather_key = os.getenv("OPENWEATHER_API_KEY")
-    groq_key = os.getenv("GROQ_API_KEY")
+    logger.info(f"🗺️ Google Maps API: {'✅ Configured' if GOOGLE_MAPS_CONFIGURED else '❌ Not configured'}")
+    logger.info(f"🌤️ OpenWeather API: {'✅ Configured' if WEATHER_CONFIGURED else '❌ Not configured'}")
+    logger.info(f"🤖 Groq AI API: {'✅ Configured' if GROQ_CONFIGURED else '❌ Not configured'}")
     
-    logger.info(f"🗺️ Google Maps API: {'✅ Configured' if google_key else '❌ Not configured'}")
-    logger.info(f"🌤️ OpenWeather API: {'✅ Configured' if weather_key else '❌ Not configured'}")
-    logger.info(f"🤖 Groq AI API: {'✅ Configured' if groq_key else '❌ Not configured'}")
+    # Opt-in (IVAS_MIXER_WARMUP=1): audio device init overlaps the rest of startup
+    start_mixer_warmup()
     
     try:
         # Initialize agent orchestrator (includes memory manager)
@@ -148,7 +194,8 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("🔄 Shutting down...")
-    # Add any cleanup logic here
+    if agent_orchestrator:
+        await agent_orchestrator.shutdown()
 
 # ====================== HELPER FUNCTIONS ======================
 
@@ -162,25 +209,50 @@ def check_auth_and_logout(response_status: int) -> bool:
     """Check if response indicates auth failure"""
     return response_status == 401
 
+async def websocket_sender(websocket: WebSocket, queue: asyncio.Queue):
+    """Write queued replies so the receive loop never waits on a slow client"""
+    try:
+        while True:
+            payload = await queue.get()
+            # The frontend parses every frame as one JSON object, so replies keep
+            # their own text frame; anything already queued goes out back-to-back
+            await websocket.send_text(payload)
+            while not queue.empty():
+                await websocket.send_text(queue.get_nowait())
+    except Exception as e:
+        logger.warning("🔌 WebSocket send failed, closing connection: %s", e)
+        # Free the queue so a receive loop blocked in put() wakes up and sees
+        # this task is done instead of waiting forever on a dead connection
+        while not queue.empty():
+            queue.get_nowait()
+
 # ====================== WEBSOCKET ENDPOINT ======================
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket connection for real-time communication"""
     await websocket.accept()
-    active_connections.append(websocket)
+    active_connections.add(websocket)
     logger.info("🔌 New WebSocket connection established")
     
+    out_queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+    sender = asyncio.create_task(websocket_sender(websocket, out_queue))
+    
     try:
         while True:
-            data = await websocket.receive_text()
-            message_data = json.loads(data)
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
+            # Binary frames go to the parser as-is, skipping the str decode;
+            # the browser frontend still sends text frames, so accept both
+            data = frame.get("bytes")
+            message_data = json_loads(data if data is not None else frame["text"])
             
             # Create agent message
             user_message = AgentMessage(
                 content=message_data.get("text", ""),
                 user_id=message_data.get("user_id", "default_user"),
-                timestamp=datetime.now(),
+                timestamp=_now(),
                 message_type="user_input",
                 user_location=message_data.get("user_location")
             )
@@ -188,8 +260,12 @@ async def websocket_endpoint(websocket: WebSocket):
             # Process through agent orchestrator
             response = await agent_orchestrator.process_message(user_message)
             
-            # Send response back
-            await websocket.send_text(json.dumps({
+            # The sender stops on a send error; the connection is dead then
+            if sender.done():
+                break
+            
+            # Queue response for the sender task
+            await out_queue.put(json_dumps({
                 "response": response.content,
                 "agent_used": response.agent_id,
                 "actions_taken": response.actions_taken,
@@ -197,12 +273,30 @@ async def websocket_endpoint(websocket: WebSocket):
                 "timestamp": response.timestamp.isoformat()
             }))
             
+        try:
+            await websocket.close()
+        except Exception:
+            pass  # already closed underneath us
+        logger.info("🔌 WebSocket connection closed after send failure")
+            
     except WebSocketDisconnect:
-        active_connections.remove(websocket)
         logger.info("🔌 WebSocket connection closed")
+    finally:
+        active_connections.discard(websocket)
+        sender.cancel()
 
 # ====================== AUTHENTICATION ENDPOINTS ======================
 
+# Map vehicle models to proper data
+_VEHICLE_DATA_MAPPING = {
+    "tesla_model_3": {"id": "tesla_model_3", "name": "Tesla Model 3"},
+    "bmw_3_series": {"id": "bmw_3_series", "name": "BMW 3 Series"},
+    "honda_civic": {"id": "honda_civic", "name": "Honda Civic"},
+    "ford_f_150": {"id": "ford_f_150", "name": "Ford F-150"},
+    "ram_1500": {"id": "ram_1500", "name": "RAM 1500"},
+    "toyota_tacoma": {"id": "toyota_tacoma", "name": "Toyota Tacoma"}
+}
+
 @app.post("/api/auth/register", response_model=AuthResponse)
 async def register_user(user_data: UserRegistration):
     """Register a new user"""
@@ -210,20 +304,10 @@ async def register_user(user_data: UserRegistration):
         if not memory_manager:
             raise HTTPException(status_code=500, detail="Memory manager not initialized")
         
-        # Map vehicle models to proper data
-        vehicle_data_mapping = {
-            "tesla_model_3": {"id": "tesla_model_3", "name": "Tesla Model 3"},
-            "bmw_3_series": {"id": "bmw_3_series", "name": "BMW 3 Series"},
-            "honda_civic": {"id": "honda_civic", "name": "Honda Civic"},
-            "ford_f_150": {"id": "ford_f_150", "name": "Ford F-150"},
-            "ram_1500": {"id": "ram_1500", "name": "RAM 1500"},
-            "toyota_tacoma": {"id": "toyota_tacoma", "name": "Toyota Tacoma"}
-        }
-        
-        vehicle_data = vehicle_data_mapping.get(user_data.vehicleModel, {
+        vehicle_data = _VEHICLE_DATA_MAPPING.get(user_data.vehicleModel) or {
             "id": user_data.vehicleModel,
             "name": user_data.vehicleModel.replace('_', ' ').title()
-        })
+        }
         
         # Register user
         success, message, user_response = await memory_manager.register_user(
@@ -287,25 +371,26 @@ async def process_voice_input(request: VoiceRequest):
                 detail=f"User '{request.user_id}' is not registered. Please register or login first."
             )
         
-        logger.info(f"🎤 Processing input from {request.user_id}: '{request.text}'")
+        logger.info("🎤 Processing input from %s: '%s'", request.user_id, request.text)
         
         # Create agent message with location data
         user_message = AgentMessage(
             content=request.text,
             user_id=request.user_id,
-            timestamp=datetime.now(),
+            timestamp=_now(),
             message_type="text_input",
             user_location=request.user_location
         )
         
         # 🔧 DEBUG: Add intent classification debugging
-        intent_result = classify_intent(request.text)
-        logger.info(f"🔍 INTENT DEBUG for '{request.text}': {intent_result}")
+        if DEBUG_INTENT and logger.isEnabledFor(logging.DEBUG):
+            intent_result = classify_intent(request.text)
+            logger.debug("🔍 INTENT DEBUG for '%s': %s", request.text, intent_result)
         
         # Process through agent orchestrator
         response = await agent_orchestrator.process_message(user_message)
         
-        logger.info(f"🎯 Response from {response.agent_id}: {response.content[:100]}...")
+        logger.info("🎯 Response from %s: %s...", response.agent_id, response.content[:100])
         
         return AgentResponse(
             response=response.content,
@@ -320,6 +405,13 @@ async def process_voice_input(request: VoiceRequest):
         logger.error(f"Voice processing error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
+# Fixed part of the upload reply; vehicle_state stays live since commands change it
+_UPLOAD_STUB_REPLY = {
+    "response": "Audio upload received. Speech recognition not yet implemented in this version.",
+    "agent_used": "system",
+    "actions_taken": ["audio_received"]
+}
+
 @app.post("/api/voice/upload")
 async def upload_audio(file: UploadFile = File(...), user_id: str = "default_user"):
     """Process uploaded audio file"""
@@ -333,12 +425,7 @@ async def upload_audio(file: UploadFile = File(...), user_id: str = "default_use
         
         # For now, return a mock response since we don't have speech recognition
         # In a real implementation, you'd use speech-to-text here
-        return {
-            "response": "Audio upload received. Speech recognition not yet implemented in this version.",
-            "agent_used": "system",
-            "actions_taken": ["audio_received"],
-            "vehicle_state": get_complete_vehicle_state()
-        }
+        return {**_UPLOAD_STUB_REPLY, "vehicle_state": get_complete_vehicle_state()}
         
     except HTTPException:
         raise
@@ -382,9 +469,9 @@ async def execute_vehicle_command(command: VehicleCommand):
         
         # Create agent message for vehicle command
         message = AgentMessage(
-            content=f"Execute {command.command} with parameters {command.parameters}",
+            content=f"Execute {command.command} with parameters {json_dumps(command.parameters)}",
             user_id=command.user_id,
-            timestamp=datetime.now(),
+            timestamp=_now(),
             message_type="vehicle_command"
         )
         
@@ -435,7 +522,6 @@ async def get_user_memory(user_id: str):
 async def get_current_weather(lat: float = 13.0827, lon: float = 80.2707):
     """Get current weather information"""
     try:
-        from tools import NavigationTools
         weather_info = await NavigationTools.get_weather(latitude=lat, longitude=lon)
         return weather_info
     except Exception as e:
@@ -446,7 +532,6 @@ async def get_current_weather(lat: float = 13.0827, lon: float = 80.2707):
 async def test_maps():
     """Test Google Maps integration"""
     try:
-        from tools import NavigationTools
         result = await NavigationTools.search_nearby_places(
             place_type="restaurant",
             latitude=13.0827,
@@ -461,7 +546,6 @@ async def test_maps():
 async def test_directions(origin: str = "Chennai", destination: str = "Bangalore"):
     """Test directions endpoint"""
     try:
-        from tools import NavigationTools
         result = await NavigationTools.get_directions(destination, latitude=13.0827, longitude=80.2707)
         return result
     except Exception as e:
@@ -484,103 +568,108 @@ async def test_intent_classification(text: str):
 
 # ====================== HEALTH CHECK ENDPOINT ======================
 
+# Parts of the health payload that are fixed for the life of the process
+_HEALTH_STATIC = {
+    "version": "3.0.0",
+    "features": {
+        "authentication": True,
+        "multi_agent_system": True,
+        "groq_ai_integration": GROQ_CONFIGURED,
+        "google_maps_integration": GOOGLE_MAPS_CONFIGURED,
+        "weather_integration": WEATHER_CONFIGURED,
+        "voice_processing": True,
+        "websocket_support": True,
+        "vehicle_state_sync": True
+    },
+    "api_status": {
+        "google_maps": "✅ Active" if GOOGLE_MAPS_CONFIGURED else "⚠️ Using fallback",
+        "weather": "✅ Active" if WEATHER_CONFIGURED else "⚠️ Using mock data",
+        "groq_ai": "✅ Active" if GROQ_CONFIGURED else "⚠️ Limited general conversation"
+    }
+}
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": _now().isoformat(),
         "components": {
             "agent_orchestrator": agent_orchestrator is not None,
             "memory_manager": memory_manager is not None,
         },
         "active_connections": len(active_connections),
-        "version": "3.0.0",
-        "features": {
-            "authentication": True,
-            "multi_agent_system": True,
-            "groq_ai_integration": bool(os.getenv("GROQ_API_KEY")),
-            "google_maps_integration": bool(os.getenv("GOOGLE_MAPS_API_KEY")),
-            "weather_integration": bool(os.getenv("OPENWEATHER_API_KEY")),
-            "voice_processing": True,
-            "websocket_support": True,
-            "vehicle_state_sync": True
-        },
-        "api_status": {
-            "google_maps": "✅ Active" if os.getenv("GOOGLE_MAPS_API_KEY") else "⚠️ Using fallback",
-            "weather": "✅ Active" if os.getenv("OPENWEATHER_API_KEY") else "⚠️ Using mock data",
-            "groq_ai": "✅ Active" if os.getenv("GROQ_API_KEY") else "⚠️ Limited general conversation"
-        }
+        **_HEALTH_STATIC
     }
 
 # ====================== ROOT ENDPOINT ======================
 
-@app.get("/")
-async def root():
-    """Welcome message with API status"""
-    google_configured = bool(os.getenv("GOOGLE_MAPS_API_KEY"))
-    weather_configured = bool(os.getenv("OPENWEATHER_API_KEY"))
-    groq_configured = bool(os.getenv("GROQ_API_KEY"))
-    
-    features = [
+# The root payload depends only on startup configuration, so build it once
+_ROOT_PAYLOAD = {
+    "message": "🚗 Agentic AI In-Vehicle Assistant v3.0",
+    "description": "Multi-agent AI system with Groq AI integration for intelligent vehicle control",
+    "features": [
         "🔐 Secure User Authentication",
         "🤖 Multi-Agent AI System (7 specialized agents)",
         "🧠 Groq AI Integration for General Conversation",
         "🎵 Music Control & Entertainment",
         "🌡️ Climate Control & HVAC",
         "🚗 Vehicle Systems (doors, lights, etc.)",
-        f"🗺️ {'Google Maps' if google_configured else 'OpenStreetMap'} Navigation",
-        f"🌤️ {'Real Weather Data' if weather_configured else 'Mock Weather'} Integration",
+        f"🗺️ {'Google Maps' if GOOGLE_MAPS_CONFIGURED else 'OpenStreetMap'} Navigation",
+        f"🌤️ {'Real Weather Data' if WEATHER_CONFIGURED else 'Mock Weather'} Integration",
         "📊 Comprehensive Vehicle Information Database",
         "👤 User Personalization & Memory",
         "📍 Real-time Location Services",
         "🔌 WebSocket Real-time Communication"
-    ]
-    
-    return {
-        "message": "🚗 Agentic AI In-Vehicle Assistant v3.0",
-        "description": "Multi-agent AI system with Groq AI integration for intelligent vehicle control",
-        "features": features,
-        "api_status": {
-            "google_maps": "✅ Active" if google_configured else "⚠️ Using OpenStreetMap fallback",
-            "weather": "✅ Active" if weather_configured else "⚠️ Using mock data",
-            "groq_ai": "✅ Active" if groq_configured else "⚠️ Limited general conversation",
-            "multi_agent_system": "✅ Active (7 specialized agents)",
-            "authentication": "✅ Active (SQLite database)"
-        },
-        "endpoints": {
-            "register": "/api/auth/register",
-            "login": "/api/auth/login",
-            "voice_input": "/api/voice/process",
-            "audio_upload": "/api/voice/upload",
-            "vehicle_status": "/api/vehicle/status",
-            "vehicle_command": "/api/vehicle/command",
-            "user_memory": "/api/memory/{user_id}",
-            "weather": "/api/weather/current",
-            "maps_test": "/api/maps/test",
-            "directions_test": "/api/maps/directions",
-            "intent_test": "/api/test/intent",
-            "websocket": "/ws",
-            "health": "/health"
-        },
-        "setup_guide": {
-            "required_env_vars": [
-                "GROQ_API_KEY - For general conversation AI",
-                "GOOGLE_MAPS_API_KEY - For enhanced navigation (optional)",
-                "OPENWEATHER_API_KEY - For real weather data (optional)"
-            ],
-            "env_file_example": "Create .env file with your API keys"
-        },
-        "agent_system": {
-            "master_agent": "Coordinates all agents and handles Groq AI fallback",
-            "climate_agent": "Temperature, AC, and HVAC control",
-            "entertainment_agent": "Music playback and audio control",
-            "vehicle_control_agent": "Doors, lights, and vehicle systems",
-            "navigation_agent": "GPS, directions, weather, and place search",
-            "vehicle_info_agent": "Vehicle database and specifications",
-            "user_experience_agent": "Personalization and general assistance"
-        }
+    ],
+    "api_status": {
+        "google_maps": "✅ Active" if GOOGLE_MAPS_CONFIGURED else "⚠️ Using OpenStreetMap fallback",
+        "weather": "✅ Active" if WEATHER_CONFIGURED else "⚠️ Using mock data",
+        "groq_ai": "✅ Active" if GROQ_CONFIGURED else "⚠️ Limited general conversation",
+        "multi_agent_system": "✅ Active (7 specialized agents)",
+        "authentication": "✅ Active (SQLite database)"
+    },
+    "endpoints": {
+        "register": "/api/auth/register",
+        "login": "/api/auth/login",
+        "voice_input": "/api/voice/process",
+        "audio_upload": "/api/voice/upload",
+        "vehicle_status": "/api/vehicle/status",
+        "vehicle_command": "/api/vehicle/command",
+        "user_memory": "/api/memory/{user_id}",
+        "weather": "/api/weather/current",
+        "maps_test": "/api/maps/test",
+        "directions_test": "/api/maps/directions",
+        "intent_test": "/api/test/intent",
+        "websocket": "/ws",
+        "health": "/health"
+    },
+    "setup_guide": {
+        "required_env_vars": [
+            "GROQ_API_KEY - For general conversation AI",
+            "GOOGLE_MAPS_API_KEY - For enhanced navigation (optional)",
+            "OPENWEATHER_API_KEY - For real weather data (optional)"
+        ],
+        "env_file_example": "Create .env file with your API keys"
+    },
+    "agent_system": {
+        "master_agent": "Coordinates all agents and handles Groq AI fallback",
+        "climate_agent": "Temperature, AC, and HVAC control",
+        "entertainment_agent": "Music playback and audio control",
+        "vehicle_control_agent": "Doors, lights, and vehicle systems",
+        "navigation_agent": "GPS, directions, weather, and place search",
+        "vehicle_info_agent": "Vehicle database and specifications",
+        "user_experience_agent": "Personalization and general assistance"
     }
+}
+
+# Serialized once as well; the handler just hands the bytes to the socket
+_ROOT_BYTES = json_dumps(_ROOT_PAYLOAD).encode("utf-8")
+
+@app.get("/")
+async def root():
+    """Welcome message with API status"""
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 # ====================== MAIN EXECUTION ======================
 
@@ -589,13 +678,15 @@ if __name__ == "__main__":
     print("\n" + "="*60)
     print("🚗 AGENTIC AI VEHICLE ASSISTANT v3.0")
     print("="*60)
-    print(f"🤖 Groq AI: {'✅ Configured' if os.getenv('GROQ_API_KEY') else '❌ Not configured'}")
-    print(f"🗺️ Google Maps: {'✅ Configured' if os.getenv('GOOGLE_MAPS_API_KEY') else '❌ Not configured'}")
-    print(f"🌤️ Weather API: {'✅ Configured' if os.getenv('OPENWEATHER_API_KEY') else '❌ Not configured'}")
+    print(f"🤖 Groq AI: {'✅ Configured' if GROQ_CONFIGURED else '❌ Not configured'}")
+    print(f"🗺️ Google Maps: {'✅ Configured' if GOOGLE_MAPS_CONFIGURED else '❌ Not configured'}")
+    print(f"🌤️ Weather API: {'✅ Configured' if WEATHER_CONFIGURED else '❌ Not configured'}")
     print(f"🔐 Authentication: ✅ Enabled (SQLite)")
     print(f"🤖 Multi-Agent System: ✅ Active (7 agents)")
     print(f"🔌 WebSocket Support: ✅ Active")
     print(f"🎯 Intent Classification: ✅ Active")
+    print(f"⚡ Event Loop: {'uvloop' if UVLOOP_AVAILABLE else 'asyncio'}")
+    print(f"⚡ HTTP Parser: {'httptools' if HTTPTOOLS_AVAILABLE else 'h11'}")
     print("="*60)
     print(f"🌐 Starting server on http://localhost:8000")
     print("📖 API Documentation: http://localhost:8000/docs")
@@ -607,5 +698,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
+        loop="uvloop" if UVLOOP_AVAILABLE else "asyncio",
+        http="httptools" if HTTPTOOLS_AVAILABLE else "h11",
         log_level="info"
     )
\ No newline at end of file
@@ -5,17 +5,31 @@ Maintains exact frontend-backend integration contracts
 """
 
 import asyncio
+import functools
+import heapq
+import html
 import json
 import logging
+import math
 import os
 import random
 import re
-import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from operator import itemgetter
+from typing import Dict, List, Optional, Any, Set, Tuple
+from urllib.parse import quote_plus
 import aiohttp
 import pygame
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Global music pause state tracking
@@ -31,7 +45,7 @@ VEHICLE_STATE = {
         "temperature": 22,
         "fan_speed": 2,
         "ac_on": False,
-        "last_updated": None
+        "last_updated_ns": None
     },
     "music": {
         "playing": False,
@@ -49,16 +63,150 @@ VEHICLE_STATE = {
     }
 }
 
-# Initialize pygame for music simulation
-try:
+# The mixer is initialized on first music command; an idle mixer can keep a
+# core busy, so servers where nobody plays music never start it. Set
+# IVAS_MIXER_WARMUP=1 to open it at server startup instead, trading that idle
+# cost for no device-open delay on the first play
+_MIXER_READY = False
+_MIXER_INIT_LOCK = asyncio.Lock()
+# 4096 frames (~93 ms at 44.1 kHz) avoids the underrun/popping loop of tiny
+# buffers; embedded deployments can tune it down to 512/1024
+MIXER_BUFFER = int(os.getenv("IVAS_MIXER_BUFFER", "4096"))
+MIXER_WARMUP = os.getenv("IVAS_MIXER_WARMUP") == "1"
+# Mixer calls block on decoding and disk; they run here instead of on the
+# event loop, and the single worker serializes access to the non-threadsafe mixer
+_MIXER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pygame-mixer")
+
+def _init_mixer():
+    """Blocking pygame mixer setup, run in an executor"""
+    # Initialize pygame mixer with better settings for music
+    pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=MIXER_BUFFER)
     pygame.mixer.init()
-    logger.info("🎵 Music system initialized")
-except Exception as e:
-    logger.warning(f"Music system initialization failed: {e}")
+
+async def _mixer_call(fn, *args):
+    """Run a blocking pygame mixer call on the mixer thread"""
+    return await asyncio.get_running_loop().run_in_executor(_MIXER_POOL, fn, *args)
+
+def _load_and_play(track_path: str):
+    """Load a track and start it; one mixer-thread hop instead of two"""
+    pygame.mixer.music.load(track_path)
+    pygame.mixer.music.play()
+
+async def _ensure_mixer():
+    """Initialize the pygame mixer once, before the first playback call"""
+    global _MIXER_READY
+    if _MIXER_READY:
+        return
+    async with _MIXER_INIT_LOCK:
+        if not _MIXER_READY:
+            try:
+                await _mixer_call(_init_mixer)
+            except Exception as e:
+                logger.warning(f"Music system initialization failed: {e}")
+                raise
+            _MIXER_READY = True
+            logger.info("🎵 Music system initialized")
+
+_mixer_warmup: Optional[asyncio.Task] = None
+
+async def _warm_mixer():
+    try:
+        await _ensure_mixer()
+    except Exception:
+        pass  # already logged; the first playback call retries
+
+def start_mixer_warmup():
+    """With IVAS_MIXER_WARMUP=1, open the audio device in the background so the first play doesn't wait on it"""
+    global _mixer_warmup
+    if MIXER_WARMUP and _mixer_warmup is None and not _MIXER_READY:
+        # Playback awaits _ensure_mixer(), which queues behind this on the init lock
+        _mixer_warmup = asyncio.get_running_loop().create_task(_warm_mixer())
+
+# Track name -> path for files in the music directory, so playback doesn't
+# stat() each track; a miss rescans, but only if the directory has changed
+MUSIC_DIR = "data/music"
+_TRACK_PATHS: Dict[str, str] = {}
+_MUSIC_DIR_MTIME: Optional[float] = None
+
+def _rebuild_track_index():
+    """Rescan the music directory if its mtime changed since the last scan"""
+    global _MUSIC_DIR_MTIME
+    try:
+        mtime = os.stat(MUSIC_DIR).st_mtime
+    except OSError:
+        _TRACK_PATHS.clear()
+        _MUSIC_DIR_MTIME = None
+        return
+    if mtime == _MUSIC_DIR_MTIME:
+        return
+    with os.scandir(MUSIC_DIR) as entries:
+        paths = {entry.name: entry.path for entry in entries if entry.is_file()}
+    _TRACK_PATHS.clear()
+    _TRACK_PATHS.update(paths)
+    _MUSIC_DIR_MTIME = mtime
+
+def _track_path(track: str) -> Optional[str]:
+    """Path of a track in the music directory, or None if it isn't there"""
+    path = _TRACK_PATHS.get(track)
+    if path is None:
+        _rebuild_track_index()
+        path = _TRACK_PATHS.get(track)
+    return path
+
+# Lowercased copy of the playlist for track-name search, rebuilt only when
+# VEHICLE_STATE["music"]["playlist"] is replaced with a new list
+_PLAYLIST_LOWER: Tuple[Optional[List[str]], List[str]] = (None, [])
+
+def _playlist_lower(playlist: List[str]) -> List[str]:
+    """Lowercased playlist names, cached per playlist list"""
+    global _PLAYLIST_LOWER
+    if _PLAYLIST_LOWER[0] is not playlist:
+        _PLAYLIST_LOWER = (playlist, [track.lower() for track in playlist])
+    return _PLAYLIST_LOWER[1]
+
+# API keys, read once; main.py loads .env before importing this module
+_GOOGLE_KEY: Optional[str] = None
+_OPENWEATHER_KEY: Optional[str] = None
+
+def reload_keys():
+    """Re-read the API keys from the environment"""
+    global _GOOGLE_KEY, _OPENWEATHER_KEY
+    _GOOGLE_KEY = os.getenv("GOOGLE_MAPS_API_KEY")
+    _OPENWEATHER_KEY = os.getenv("OPENWEATHER_API_KEY")
+
+reload_keys()
+
+# Shared HTTP session for all external API calls (Google Maps, OpenWeather)
+_http_session: Optional[aiohttp.ClientSession] = None
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Get the shared aiohttp session, creating it on first use"""
+    global _http_session
+    if _http_session is None or _http_session.closed:
+        _http_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=100, limit_per_host=32, ttl_dns_cache=300, keepalive_timeout=75)
+        )
+    return _http_session
+
+async def close_http_session():
+    """Close the shared aiohttp session"""
+    global _http_session
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = None
+
+# Bumped on every VEHICLE_STATE write; the frontend snapshot is rebuilt only
+# when it changes, so reads between mutations share one dict (read-only!)
+_STATE_VERSION = 0
+_snapshot_cache: Optional[Tuple[int, Dict]] = None
 
 def get_complete_vehicle_state() -> Dict:
     """Get complete vehicle state formatted for frontend"""
-    return {
+    global _snapshot_cache
+    cache = _snapshot_cache
+    if cache is not None and cache[0] == _STATE_VERSION:
+        return cache[1]
+    snapshot = {
         "climate": {
             "temperature": VEHICLE_STATE["climate"]["temperature"],
             "ac_on": VEHICLE_STATE["climate"]["ac_on"],
@@ -74,13 +222,32 @@ def get_complete_vehicle_state() -> Dict:
             "lights_on": VEHICLE_STATE["vehicle"]["lights_on"]
         }
     }
+    _snapshot_cache = (_STATE_VERSION, snapshot)
+    return snapshot
+
+@functools.lru_cache(maxsize=16)
+def _format_ts(ns: int) -> str:
+    """ISO timestamp for a time.time_ns() value; repeat reads hit the cache"""
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
+def get_category_state(category: str) -> Dict:
+    """Copy of one VEHICLE_STATE category with last_updated as an ISO string"""
+    state = dict(VEHICLE_STATE[category])
+    if "last_updated_ns" in state:
+        ns = state.pop("last_updated_ns")
+        state["last_updated"] = _format_ts(ns) if ns is not None else None
+    return state
 
 def update_vehicle_state(category: str, updates: Dict) -> Dict:
     """Update vehicle state and return formatted response for frontend"""
-    VEHICLE_STATE[category].update(updates)
-    VEHICLE_STATE[category]["last_updated"] = datetime.now().isoformat()
+    global _STATE_VERSION
+    state = VEHICLE_STATE[category]
+    state.update(updates)
+    # Store the raw clock; it is only formatted when a status call exposes it
+    state["last_updated_ns"] = time.time_ns()
+    _STATE_VERSION += 1
     
-    logger.info(f"🚗 Vehicle state updated - {category}: {updates}")
+    logger.info("🚗 Vehicle state updated - %s: %s", category, updates)
     
     # Return complete state for frontend sync
     return get_complete_vehicle_state()
@@ -151,12 +318,20 @@ class ClimateTools:
         """Get current climate status"""
         return {
             "success": True,
-            "climate_state": VEHICLE_STATE["climate"],
+            "climate_state": get_category_state("climate"),
             "vehicle_state": get_complete_vehicle_state()
         }
 
 # ====================== MUSIC CONTROL TOOLS ======================
 
+# (UI playing, mixer paused) -> (mixer call, paused after, UI playing after,
+# reply, log line). (False, False) is absent: that is the restart path
+_PAUSE_TRANSITIONS = {
+    (True, False): (pygame.mixer.music.pause, True, False, "🎵 Music paused", "🎵 ACTUALLY PAUSED music"),
+    (False, True): (pygame.mixer.music.unpause, False, True, "🎵 Music resumed", "🎵 ACTUALLY RESUMED music"),
+    (True, True): (pygame.mixer.music.pause, True, False, "🎵 Music paused (forced)", "🎵 FORCED PAUSE"),
+}
+
 class MusicTools:
     """Music and entertainment system tools with FIXED pause/resume"""
     
@@ -164,7 +339,6 @@ class MusicTools:
     async def play_music(track_name: Optional[str] = None) -> Dict:
         """Play ACTUAL music from files"""
         try:
-            music_dir = "data/music"
             playlist = VEHICLE_STATE["music"]["playlist"]
             current_index = VEHICLE_STATE["music"]["current_index"]
             
@@ -172,21 +346,22 @@ class MusicTools:
             if not playlist or playlist[0] in ["No music files found", "Music system error"]:
                 return {
                     "success": False,
-                    "message": f"🎵 No music files found. Add MP3/WAV files to {os.path.abspath(music_dir)}/"
+                    "message": f"🎵 No music files found. Add MP3/WAV files to {os.path.abspath(MUSIC_DIR)}/"
                 }
             
             # If specific track requested, try to find it
             if track_name:
-                for i, track in enumerate(playlist):
-                    if track_name.lower() in track.lower():
-                        current_index = i
-                        break
+                needle = track_name.lower()
+                current_index = next(
+                    (i for i, track in enumerate(_playlist_lower(playlist)) if needle in track),
+                    current_index
+                )
             
             current_track = playlist[current_index] if playlist else "No track"
-            track_path = os.path.join(music_dir, current_track)
+            track_path = _track_path(current_track)
             
             # Check if file actually exists
-            if not os.path.exists(track_path):
+            if track_path is None:
                 return {
                     "success": False,
                     "message": f"🎵 Music file not found: {current_track}"
@@ -194,14 +369,14 @@ class MusicTools:
             
             # 🎵 ACTUALLY PLAY THE MUSIC!
             try:
-                pygame.mixer.music.load(track_path)
-                pygame.mixer.music.play()
+                await _ensure_mixer()
+                await _mixer_call(_load_and_play, track_path)
                 
                 # 🔧 FIXED: Update pause state tracking
                 MUSIC_PAUSED_STATE["is_paused"] = False
                 MUSIC_PAUSED_STATE["current_file"] = track_path
                 
-                logger.info(f"🎵 ACTUALLY PLAYING: {current_track} from {track_path}")
+                logger.info("🎵 ACTUALLY PLAYING: %s from %s", current_track, track_path)
                 
                 # Update state
                 updates = {
@@ -220,72 +395,56 @@ class MusicTools:
                 }
                 
             except pygame.error as e:
-                logger.error(f"🎵 Pygame playback error: {e}")
+                logger.error("🎵 Pygame playback error: %s", e)
                 return {
                     "success": False,
                     "message": f"🎵 Cannot play {current_track}. Error: {str(e)}"
                 }
             
         except Exception as e:
-            logger.error(f"🎵 Music play error: {e}")
+            logger.error("🎵 Music play error: %s", e)
             return {"success": False, "message": f"Failed to play music: {e}"}
     
     @staticmethod
     async def pause_music() -> Dict:
         """🔧 FIXED: Pause/resume ACTUAL music playback with proper state tracking"""
         try:
+            await _ensure_mixer()
             current_playing = VEHICLE_STATE["music"]["playing"]
             is_pygame_paused = MUSIC_PAUSED_STATE["is_paused"]
             
-            logger.info(f"🎵 DEBUG: current_playing={current_playing}, is_pygame_paused={is_pygame_paused}")
-            
-            # Check if music is actually playing using pygame
-            is_music_busy = pygame.mixer.music.get_busy()
-            logger.info(f"🎵 DEBUG: pygame.mixer.music.get_busy()={is_music_busy}")
-            
-            if current_playing and not is_pygame_paused:
-                # Currently playing - pause it
-                pygame.mixer.music.pause()
-                MUSIC_PAUSED_STATE["is_paused"] = True
-                new_state = False  # UI shows paused
-                message = "🎵 Music paused"
-                logger.info("🎵 ACTUALLY PAUSED music")
-                
-            elif not current_playing and is_pygame_paused:
-                # Currently paused - resume it
-                pygame.mixer.music.unpause()
-                MUSIC_PAUSED_STATE["is_paused"] = False
-                new_state = True  # UI shows playing
-                message = "🎵 Music resumed"
-                logger.info("🎵 ACTUALLY RESUMED music")
-                
-            elif not current_playing and not is_pygame_paused:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("🎵 DEBUG: current_playing=%s, is_pygame_paused=%s", current_playing, is_pygame_paused)
+                # Check if music is actually playing using pygame; only worth a
+                # mixer-thread round trip when someone reads the debug log
+                is_music_busy = await _mixer_call(pygame.mixer.music.get_busy)
+                logger.debug("🎵 DEBUG: pygame.mixer.music.get_busy()=%s", is_music_busy)
+            
+            transition = _PAUSE_TRANSITIONS.get((current_playing, is_pygame_paused))
+            if transition is not None:
+                # Pause, resume or forced pause: one mixer call plus state flags
+                mixer_fn, now_paused, new_state, message, log_line = transition
+                await _mixer_call(mixer_fn)
+                MUSIC_PAUSED_STATE["is_paused"] = now_paused
+                logger.info(log_line)
+            else:
                 # Music was stopped or never started - restart the current track
                 current_track = VEHICLE_STATE["music"]["current_track"]
-                music_dir = "data/music"
-                track_path = os.path.join(music_dir, current_track)
+                track_path = _track_path(current_track)
                 
-                if os.path.exists(track_path):
+                if track_path is not None:
                     try:
-                        pygame.mixer.music.load(track_path)
-                        pygame.mixer.music.play()
+                        await _mixer_call(_load_and_play, track_path)
                         MUSIC_PAUSED_STATE["is_paused"] = False
                         MUSIC_PAUSED_STATE["current_file"] = track_path
                         new_state = True
                         message = f"🎵 Restarted: {current_track}"
-                        logger.info(f"🎵 RESTARTED music: {current_track}")
+                        logger.info("🎵 RESTARTED music: %s", current_track)
                     except pygame.error as e:
-                        logger.error(f"🎵 Error restarting music: {e}")
+                        logger.error("🎵 Error restarting music: %s", e)
                         return {"success": False, "message": f"Cannot restart music: {str(e)}"}
                 else:
                     return {"success": False, "message": f"Music file not found: {current_track}"}
-            else:
-                # Edge case - force pause
-                pygame.mixer.music.pause()
-                MUSIC_PAUSED_STATE["is_paused"] = True
-                new_state = False
-                message = "🎵 Music paused (forced)"
-                logger.info("🎵 FORCED PAUSE")
             
             vehicle_state = update_vehicle_state("music", {"playing": new_state})
             
@@ -296,68 +455,24 @@ class MusicTools:
             }
             
         except Exception as e:
-            logger.error(f"🎵 Pause/resume error: {e}")
+            logger.error("🎵 Pause/resume error: %s", e)
             return {"success": False, "message": f"Failed to pause/resume music: {e}"}
     
     @staticmethod
     async def next_track() -> Dict:
         """Switch to next track and ACTUALLY play it"""
-        try:
-            playlist = VEHICLE_STATE["music"]["playlist"]
-            current_index = VEHICLE_STATE["music"]["current_index"]
-            
-            if not playlist or playlist[0] in ["No music files found", "Music system error"]:
-                return {"success": False, "message": "No music files available"}
-            
-            # Move to next track (loop back to start if at end)
-            next_index = (current_index + 1) % len(playlist)
-            next_track = playlist[next_index]
-            
-            # Stop current music
-            pygame.mixer.music.stop()
-            
-            # Load and play next track
-            music_dir = "data/music"
-            track_path = os.path.join(music_dir, next_track)
-            
-            if os.path.exists(track_path):
-                try:
-                    pygame.mixer.music.load(track_path)
-                    pygame.mixer.music.play()
-                    
-                    # 🔧 FIXED: Update pause state
-                    MUSIC_PAUSED_STATE["is_paused"] = False
-                    MUSIC_PAUSED_STATE["current_file"] = track_path
-                    
-                    logger.info(f"🎵 ACTUALLY PLAYING NEXT: {next_track}")
-                    
-                    updates = {
-                        "current_index": next_index,
-                        "current_track": next_track,
-                        "track_position": 0,
-                        "playing": True
-                    }
-                    
-                    vehicle_state = update_vehicle_state("music", updates)
-                    
-                    return {
-                        "success": True,
-                        "message": f"🎵 Next track: {next_track}",
-                        "vehicle_state": vehicle_state
-                    }
-                    
-                except pygame.error as e:
-                    logger.error(f"🎵 Error playing next track: {e}")
-                    return {"success": False, "message": f"Cannot play {next_track}: {str(e)}"}
-            else:
-                return {"success": False, "message": f"Next track file not found: {next_track}"}
-                
-        except Exception as e:
-            return {"success": False, "message": f"Failed to switch track: {e}"}
+        # Move to next track (loop back to start if at end)
+        return await MusicTools._switch_track(1, "Next")
     
     @staticmethod
     async def previous_track() -> Dict:
         """Switch to previous track and ACTUALLY play it"""
+        # Move to previous track (loop to end if at start)
+        return await MusicTools._switch_track(-1, "Previous")
+    
+    @staticmethod
+    async def _switch_track(step: int, label: str) -> Dict:
+        """Step through the playlist by step, wrapping around, and play that track"""
         try:
             playlist = VEHICLE_STATE["music"]["playlist"]
             current_index = VEHICLE_STATE["music"]["current_index"]
@@ -365,31 +480,29 @@ class MusicTools:
             if not playlist or playlist[0] in ["No music files found", "Music system error"]:
                 return {"success": False, "message": "No music files available"}
             
-            # Move to previous track (loop to end if at start)
-            prev_index = (current_index - 1) % len(playlist)
-            prev_track = playlist[prev_index]
+            new_index = (current_index + step) % len(playlist)
+            new_track = playlist[new_index]
             
             # Stop current music
-            pygame.mixer.music.stop()
+            await _ensure_mixer()
+            await _mixer_call(pygame.mixer.music.stop)
             
-            # Load and play previous track
-            music_dir = "data/music"
-            track_path = os.path.join(music_dir, prev_track)
+            # Load and play the new track
+            track_path = _track_path(new_track)
             
-            if os.path.exists(track_path):
+            if track_path is not None:
                 try:
-                    pygame.mixer.music.load(track_path)
-                    pygame.mixer.music.play()
+                    await _mixer_call(_load_and_play, track_path)
                     
                     # 🔧 FIXED: Update pause state
                     MUSIC_PAUSED_STATE["is_paused"] = False
                     MUSIC_PAUSED_STATE["current_file"] = track_path
                     
-                    logger.info(f"🎵 ACTUALLY PLAYING PREVIOUS: {prev_track}")
+                    logger.info("🎵 ACTUALLY PLAYING %s: %s", label.upper(), new_track)
                     
                     updates = {
-                        "current_index": prev_index,
-                        "current_track": prev_track,
+                        "current_index": new_index,
+                        "current_track": new_track,
                         "track_position": 0,
                         "playing": True
                     }
@@ -398,15 +511,15 @@ class MusicTools:
                     
                     return {
                         "success": True,
-                        "message": f"🎵 Previous track: {prev_track}",
+                        "message": f"🎵 {label} track: {new_track}",
                         "vehicle_state": vehicle_state
                     }
                     
                 except pygame.error as e:
-                    logger.error(f"🎵 Error playing previous track: {e}")
-                    return {"success": False, "message": f"Cannot play {prev_track}: {str(e)}"}
+                    logger.error("🎵 Error playing %s track: %s", label.lower(), e)
+                    return {"success": False, "message": f"Cannot play {new_track}: {str(e)}"}
             else:
-                return {"success": False, "message": f"Previous track file not found: {prev_track}"}
+                return {"success": False, "message": f"{label} track file not found: {new_track}"}
                 
         except Exception as e:
             return {"success": False, "message": f"Failed to switch track: {e}"}
@@ -418,10 +531,11 @@ class MusicTools:
             volume = max(0, min(100, volume))
             
             # Set pygame mixer volume (0.0 to 1.0)
+            await _ensure_mixer()
             pygame_volume = volume / 100.0
-            pygame.mixer.music.set_volume(pygame_volume)
+            await _mixer_call(pygame.mixer.music.set_volume, pygame_volume)
             
-            logger.info(f"🎵 ACTUALLY SET VOLUME to {volume}% (pygame: {pygame_volume})")
+            logger.info("🎵 ACTUALLY SET VOLUME to %s%% (pygame: %s)", volume, pygame_volume)
             
             vehicle_state = update_vehicle_state("music", {"volume": volume})
             
@@ -439,9 +553,9 @@ class MusicTools:
         """Get current music system status with pause state"""
         return {
             "success": True,
-            "music_state": VEHICLE_STATE["music"],
+            "music_state": get_category_state("music"),
             "pause_state": MUSIC_PAUSED_STATE,
-            "pygame_busy": pygame.mixer.music.get_busy(),
+            "pygame_busy": _MIXER_READY and await _mixer_call(pygame.mixer.music.get_busy),
             "vehicle_state": get_complete_vehicle_state()
         }
 
@@ -500,12 +614,81 @@ class VehicleTools:
         """Get comprehensive vehicle status"""
         return {
             "success": True,
-            "vehicle_state": VEHICLE_STATE["vehicle"],
+            "vehicle_state": get_category_state("vehicle"),
             "complete_state": get_complete_vehicle_state()
         }
 
 # ====================== NAVIGATION TOOLS ======================
 
+# Reverse geocoding results keyed by coordinates rounded to ~11 m. Location
+# heartbeats re-send the same spot, so fresh hits skip the API call; stale
+# hits are served immediately while a background task refreshes them
+_GEOCODE_CACHE: "OrderedDict[Tuple[float, float], Tuple[float, str]]" = OrderedDict()
+_GEOCODE_FRESH_S = 600
+_GEOCODE_STALE_S = 86400
+_GEOCODE_MAX_ENTRIES = 2048
+_geocode_refreshing: Set[Tuple[float, float]] = set()
+_geocode_tasks: Set[asyncio.Task] = set()
+
+# Weather changes slowly and Places results barely at all, so successful API
+# answers are reused for nearby coordinates instead of spending quota again
+_WEATHER_CACHE: "OrderedDict[Tuple, Tuple[float, Dict]]" = OrderedDict()
+_WEATHER_TTL_S = 600
+_PLACES_CACHE: "OrderedDict[Tuple, Tuple[float, List[Dict]]]" = OrderedDict()
+_PLACES_TTL_S = 3600
+_API_CACHE_MAX_ENTRIES = 1024
+
+def _cache_get(cache: OrderedDict, key: Tuple, ttl: float) -> Any:
+    """Cached value if younger than ttl seconds, else None"""
+    hit = cache.get(key)
+    if hit is not None and time.monotonic() - hit[0] < ttl:
+        cache.move_to_end(key)
+        return hit[1]
+    return None
+
+def _cache_put(cache: OrderedDict, key: Tuple, value: Any, max_entries: int):
+    """Insert or refresh a cached value, evicting the least recently used"""
+    cache[key] = (time.monotonic(), value)
+    cache.move_to_end(key)
+    if len(cache) > max_entries:
+        cache.popitem(last=False)
+
+# Splits "City , State,Country" into trimmed parts in one C-level pass
+_ADDR_SPLIT_RE = re.compile(r"\s*,\s*")
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+_INDIAN_CITIES = frozenset({'chennai', 'mumbai', 'delhi', 'bangalore', 'hyderabad', 'pune', 'kolkata'})
+
+_EARTH_R_KM = 6371.0
+
+# Identical GETs already in flight share one request; at most 8 hit the network at once
+_HTTP_INFLIGHT: Dict[Tuple, asyncio.Task] = {}
+_HTTP_SEMAPHORE = asyncio.Semaphore(8)
+
+async def _fetch_json(url: str, params: Optional[Dict], timeout: float) -> Tuple[int, Any]:
+    async with _HTTP_SEMAPHORE:
+        session = get_http_session()
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            if response.status == 200:
+                body = await response.read()
+                return response.status, orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+            return response.status, None
+
+async def _get_json(url: str, params: Optional[Dict] = None, timeout: float = 10) -> Tuple[int, Any]:
+    """GET a JSON API; returns (status, parsed body or None for non-200)"""
+    key = (url, tuple(sorted(params.items())) if params else ())
+    task = _HTTP_INFLIGHT.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_json(url, params, timeout))
+        _HTTP_INFLIGHT[key] = task
+        
+        def _done(t: asyncio.Task):
+            _HTTP_INFLIGHT.pop(key, None)
+            if not t.cancelled():
+                t.exception()  # waiters may all have been cancelled
+        task.add_done_callback(_done)
+    # Shielded so one caller being cancelled doesn't fail the others
+    return await asyncio.shield(task)
+
 class NavigationTools:
     """Enhanced navigation with comprehensive place search and tourist attractions"""
     
@@ -600,6 +783,18 @@ class NavigationTools:
         ]
     }
     
+    # Same data as flat tuples; results are jittered per call so they can't be
+    # cached whole, but this skips a dict copy and four key lookups per place.
+    # Rows are pre-ordered by distance: jitter only nudges neighbours, so the
+    # per-call sort sees nearly sorted input and finishes in about one pass
+    _MOCK_PLACE_ROWS = {
+        place_type: tuple(sorted(
+            ((p["name"], p["distance"], p["rating"], p["category"]) for p in places),
+            key=itemgetter(1)
+        ))
+        for place_type, places in MOCK_PLACES_DATA.items()
+    }
+    
     @staticmethod
     async def get_current_location(latitude: Optional[float] = None, longitude: Optional[float] = None) -> Dict:
         """Get current GPS location with reverse geocoding"""
@@ -615,14 +810,9 @@ class NavigationTools:
                 
                 # Format response prioritizing city name
                 if "," in address:
-                    address_parts = [part.strip() for part in address.split(',')]
-                    # Use the most specific location parts
-                    if len(address_parts) >= 3:
-                        location_message = f"📍 You are in {address_parts[0]}, {address_parts[1]}, {address_parts[2]}"
-                    elif len(address_parts) >= 2:
-                        location_message = f"📍 You are in {address_parts[0]}, {address_parts[1]}"
-                    else:
-                        location_message = f"📍 Your current location: {address}"
+                    address_parts = _ADDR_SPLIT_RE.split(address.strip())
+                    # Use the most specific location parts (up to three)
+                    location_message = f"📍 You are in {', '.join(address_parts[:3])}"
                 else:
                     location_message = f"📍 Your current location: {address}"
                 
@@ -651,6 +841,11 @@ class NavigationTools:
                 "message": f"Unable to get current location: {e}"
             }
     
+    @staticmethod
+    def _maps_url(start_lat: float, start_lon: float, destination: str) -> str:
+        """Google Maps directions link, with the destination URL-encoded"""
+        return f"https://www.google.com/maps/dir/{start_lat},{start_lon}/{quote_plus(destination)}"
+    
     @staticmethod
     async def get_directions(destination: str, latitude: Optional[float] = None, longitude: Optional[float] = None) -> Dict:
         """Get directions to destination"""
@@ -662,7 +857,7 @@ class NavigationTools:
             logger.info(f"🗺️ Getting directions to '{destination}' from {start_lat}, {start_lon}")
             
             # Try Google Directions API
-            google_api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+            google_api_key = _GOOGLE_KEY
             if google_api_key:
                 directions = await NavigationTools._get_google_directions(start_lat, start_lon, destination, google_api_key)
                 if directions:
@@ -673,13 +868,17 @@ class NavigationTools:
                     }
             
             # Fallback response
-            maps_url = f"https://www.google.com/maps/dir/{start_lat},{start_lon}/{destination.replace(' ', '+')}"
-            
-            response = f"🧭 Navigation to {destination}\n"
-            response += f"📍 Destination: {destination}\n"
-            response += f"📏 Distance: Calculating...\n"
-            response += f"⏱️ Duration: Calculating...\n"
-            response += f"\n🌐 Open in Google Maps: {maps_url}"
+            maps_url = NavigationTools._maps_url(start_lat, start_lon, destination)
+            
+            parts = [
+                f"🧭 Navigation to {destination}",
+                f"📍 Destination: {destination}",
+                "📏 Distance: Calculating...",
+                "⏱️ Duration: Calculating...",
+                "",
+                f"🌐 Open in Google Maps: {maps_url}",
+            ]
+            response = "\n".join(parts)
             
             return {
                 "success": True,
@@ -705,7 +904,7 @@ class NavigationTools:
             logger.info(f"🔍 Enhanced search for {place_type} near {search_lat}, {search_lon}")
             
             # Try Google Places API first
-            google_api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+            google_api_key = _GOOGLE_KEY
             if google_api_key:
                 places = await NavigationTools._search_google_places(search_lat, search_lon, place_type, radius_km, google_api_key)
                 if places and len(places) >= 3:  # Only use Google if we get good results
@@ -729,23 +928,24 @@ class NavigationTools:
     def _get_enhanced_mock_places(place_type: str) -> List[Dict]:
         """🔧 ENHANCED: Get comprehensive mock places for different types"""
         # Get base places for the type
-        base_places = NavigationTools.MOCK_PLACES_DATA.get(place_type, [])
+        base_places = NavigationTools._MOCK_PLACE_ROWS.get(place_type)
         
         if base_places:
             # Add some random variation to distances and ratings
-            enhanced_places = []
-            for place in base_places:
-                enhanced_place = place.copy()
-                # Add slight random variation to make it more realistic
-                enhanced_place["distance"] += random.uniform(-0.2, 0.3)
-                enhanced_place["distance"] = max(0.1, enhanced_place["distance"])  # Ensure positive
-                enhanced_place["rating"] += random.uniform(-0.1, 0.2)
-                enhanced_place["rating"] = min(5.0, max(3.0, enhanced_place["rating"]))  # Keep in range
-                enhanced_places.append(enhanced_place)
-            
-            # Sort by distance and return up to 8 places
-            enhanced_places.sort(key=lambda x: x['distance'])
-            return enhanced_places[:8]
+            uniform = random.uniform
+            enhanced_places = [
+                {
+                    "name": name,
+                    # Add slight random variation to make it more realistic
+                    "distance": max(0.1, distance + uniform(-0.2, 0.3)),  # Ensure positive
+                    "rating": min(5.0, max(3.0, rating + uniform(-0.1, 0.2))),  # Keep in range
+                    "category": category
+                }
+                for name, distance, rating, category in base_places
+            ]
+            
+            # Return up to 8 places, nearest first
+            return heapq.nsmallest(8, enhanced_places, key=itemgetter("distance"))
         
         # Generic fallback for unknown types
         return [
@@ -755,76 +955,11 @@ class NavigationTools:
             {"name": f"Top-rated {place_type.title().replace('_', ' ')}", "distance": 2.5, "rating": 4.3, "category": "Highly Rated"}
         ]
     
-    @staticmethod
-    def _extract_place_type(message: str) -> str:
-        """🔧 ENHANCED: Extract place type with comprehensive tourist attraction support"""
-        message_lower = message.lower()
-        
-        # 🔧 ENHANCED: Tourist attractions and sightseeing
-        if any(word in message_lower for word in [
-            'visit', 'tourist', 'attraction', 'sightseeing', 'landmark', 'monument', 
-            'places to visit', 'tourist attractions', 'sightseeing spots', 'points of interest',
-            'tourist places', 'visiting spots', 'places to see', 'must visit', 'tourist spots',
-            'scenic places', 'beautiful places', 'famous places', 'popular places'
-        ]):
-            logger.info("🔧 Detected tourist attraction request")
-            return 'tourist_attraction'
-        
-        # 🔧 ENHANCED: Hotels/lodging detection
-        elif any(word in message_lower for word in ['hotel', 'hotels', 'lodging', 'accommodation', 'stay', 'guest house', 'resort']):
-            logger.info("🔧 Detected hotel/lodging request")
-            return 'lodging'
-        
-        # 🔧 ENHANCED: Restaurants and dining
-        elif any(word in message_lower for word in ['restaurant', 'restaurants', 'food', 'eat', 'dine', 'dining', 'meal', 'lunch', 'dinner', 'breakfast']):
-            logger.info("🔧 Detected restaurant request")
-            return 'restaurant'
-        
-        # 🔧 ENHANCED: Places of worship
-        elif any(word in message_lower for word in ['temple', 'temples', 'church', 'churches', 'mosque', 'mosques', 'worship', 'religious', 'pray', 'prayer', 'shrine']):
-            logger.info("🔧 Detected worship place request")
-            return 'place_of_worship'
-        
-        # 🔧 ENHANCED: Shopping
-        elif any(word in message_lower for word in ['mall', 'shopping', 'store', 'shop', 'shops', 'market', 'shopping center', 'bazaar', 'retail']):
-            logger.info("🔧 Detected shopping request")
-            return 'shopping_mall'
-        
-        # Medical facilities
-        elif any(word in message_lower for word in ['hospital', 'hospitals', 'medical', 'clinic', 'doctor', 'health', 'pharmacy', 'medical center']):
-            logger.info("🔧 Detected hospital request")
-            return 'hospital'
-        
-        # Coffee shops and cafes
-        elif any(word in message_lower for word in ['coffee', 'cafe', 'cafes', 'coffee shop', 'tea', 'beverages']):
-            logger.info("🔧 Detected cafe request")
-            return 'cafe'
-        
-        # Gas stations
-        elif any(word in message_lower for word in ['gas', 'fuel', 'petrol', 'station', 'gas station', 'fuel station']):
-            logger.info("🔧 Detected gas station request")
-            return 'gas_station'
-        
-        # Banks and ATMs
-        elif any(word in message_lower for word in ['bank', 'banks', 'atm', 'banking', 'financial']):
-            logger.info("🔧 Detected bank request")
-            return 'bank'
-        
-        # Default to tourist attractions for general "places" queries
-        elif any(word in message_lower for word in ['places', 'spots', 'locations', 'areas']):
-            logger.info("🔧 Detected general places request - defaulting to tourist attractions")
-            return 'tourist_attraction'
-        
-        # Generic establishment fallback
-        else:
-            logger.info("🔧 Using default establishment type")
-            return 'establishment'
-    
     @staticmethod
     async def get_weather(location: Optional[str] = None, latitude: Optional[float] = None, longitude: Optional[float] = None) -> Dict:
         """Get weather information"""
         try:
-            api_key = os.getenv("OPENWEATHER_API_KEY")
+            api_key = _OPENWEATHER_KEY
             
             if not api_key:
                 logger.warning("OpenWeather API key not found, using mock data")
@@ -834,39 +969,47 @@ class NavigationTools:
             if location:
                 # City-based weather
                 clean_location = location.strip().title()
-                if not any(country in clean_location.lower() for country in [',in', ',india']):
-                    # Add India for better accuracy
-                    indian_cities = ['chennai', 'mumbai', 'delhi', 'bangalore', 'hyderabad', 'pune', 'kolkata']
-                    if clean_location.lower() in indian_cities:
-                        clean_location += ',IN'
+                # Add India for better accuracy (a bare city name never has a ",in" suffix)
+                if clean_location.lower() in _INDIAN_CITIES:
+                    clean_location += ',IN'
                 
                 url = f"https://api.openweathermap.org/data/2.5/weather?q={clean_location}&appid={api_key}&units=metric"
+                cache_key = ("q", clean_location)
                 
             elif latitude is not None and longitude is not None:
                 # Coordinate-based weather
                 url = f"https://api.openweathermap.org/data/2.5/weather?lat={latitude}&lon={longitude}&appid={api_key}&units=metric"
+                # ~1 km cells; weather doesn't differ across the street
+                cache_key = (round(latitude, 2), round(longitude, 2))
                 
             else:
                 # Fallback coordinates
                 url = f"https://api.openweathermap.org/data/2.5/weather?lat=16.7206&lon=81.1071&appid={api_key}&units=metric"
+                cache_key = (16.72, 81.11)
+            
+            cached = _cache_get(_WEATHER_CACHE, cache_key, _WEATHER_TTL_S)
+            if cached is not None:
+                return dict(cached)
             
             # Make API request
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return NavigationTools._format_weather_response(data)
-                    elif response.status == 404:
-                        if location:
-                            return {
-                                "success": False,
-                                "message": f"❌ Sorry, I couldn't find weather information for '{location}'. Please check the city name and try again."
-                            }
-                        else:
-                            return await NavigationTools._get_mock_weather(location, latitude, longitude)
-                    else:
-                        logger.warning(f"OpenWeather API error: {response.status}")
-                        return await NavigationTools._get_mock_weather(location, latitude, longitude)
+            status, data = await _get_json(url, timeout=10)
+            if status == 200:
+                result = NavigationTools._format_weather_response(data)
+                if result.get("weather"):
+                    _cache_put(_WEATHER_CACHE, cache_key, result, _API_CACHE_MAX_ENTRIES)
+                    return dict(result)
+                return result
+            elif status == 404:
+                if location:
+                    return {
+                        "success": False,
+                        "message": f"❌ Sorry, I couldn't find weather information for '{location}'. Please check the city name and try again."
+                    }
+                else:
+                    return await NavigationTools._get_mock_weather(location, latitude, longitude)
+            else:
+                logger.warning(f"OpenWeather API error: {status}")
+                return await NavigationTools._get_mock_weather(location, latitude, longitude)
             
         except Exception as e:
             logger.error(f"Weather API request failed: {e}")
@@ -908,30 +1051,30 @@ class NavigationTools:
         elif place_type == 'lodging':
             place_type_display = "hotels"
         
-        message = f"🔍 Found {len(places)} {place_type_display} near you:\n\n"
+        parts = [f"🔍 Found {len(places)} {place_type_display} near you:", ""]
         
         for i, place in enumerate(places[:8]):  # Show up to 8 places
             name = place['name']
             distance = place['distance']
             category = place.get('category', 'Local Business')
             
-            place_info = f"📍 {name}"
+            place_info = [f"{i+1}. 📍 {name}"]
             
             # Add category info
             if category and category != 'Local Business':
-                place_info += f" ({category})"
+                place_info.append(f" ({category})")
             
             # Add distance
             if distance < 1:
-                place_info += f" - {int(distance * 1000)}m away"
+                place_info.append(f" - {int(distance * 1000)}m away")
             else:
-                place_info += f" - {distance:.1f}km away"
+                place_info.append(f" - {distance:.1f}km away")
             
             # Add rating if available
             if place.get('rating'):
-                place_info += f" ⭐ {place['rating']}/5"
+                place_info.append(f" ⭐ {place['rating']}/5")
             
-            message += f"{i+1}. {place_info}\n"
+            parts.append("".join(place_info))
         
         # Enhanced suggestions based on place type
         suggestion_text = "💡 Say 'navigate to [place name]' for directions"
@@ -940,7 +1083,9 @@ class NavigationTools:
         elif place_type == 'restaurant':
             suggestion_text += " or ask about 'hotels near [restaurant name]'"
         
-        message += f"\n{suggestion_text}"
+        parts.append("")
+        parts.append(suggestion_text)
+        message = "\n".join(parts)
         
         return {
             "success": True,
@@ -963,56 +1108,56 @@ class NavigationTools:
                 "units": "metric"
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                    if response.status == 200:
-                        data = await response.json()
+            status, data = await _get_json(url, params, timeout=15)
+            if status == 200:
+                    
+                if data.get("status") == "OK" and data.get("routes"):
+                    route = data["routes"][0]
+                    leg = route["legs"][0]
                         
-                        if data.get("status") == "OK" and data.get("routes"):
-                            route = data["routes"][0]
-                            leg = route["legs"][0]
-                            
-                            distance = leg["distance"]["text"]
-                            duration = leg["duration"]["text"]
-                            end_address = leg["end_address"]
-                            
-                            # Extract turn-by-turn instructions
-                            instructions = []
-                            for step in leg["steps"]:
-                                instruction = step["html_instructions"]
-                                # Clean HTML tags
-                                instruction = re.sub('<.*?>', '', instruction)
-                                step_distance = step["distance"]["text"]
-                                instructions.append(f"{instruction} ({step_distance})")
-                            
-                            # Create Google Maps URL
-                            maps_url = f"https://www.google.com/maps/dir/{start_lat},{start_lon}/{destination.replace(' ', '+')}"
-                            
-                            # Format response
-                            response = f"🧭 Navigation Route\n"
-                            response += f"📍 Destination: {end_address}\n"
-                            response += f"📏 Distance: {distance}\n"
-                            response += f"⏱️ Duration: {duration}\n"
-                            
-                            if len(instructions) > 0:
-                                response += f"\n🗺️ Turn-by-Turn Directions:\n"
-                                for i, instruction in enumerate(instructions[:6], 1):  # Show first 6 steps
-                                    response += f"{i}. {instruction}\n"
-                                
-                                if len(instructions) > 6:
-                                    response += f"... and {len(instructions) - 6} more steps\n"
-                            
-                            response += f"\n🌐 Open in Google Maps: {maps_url}"
-                            
-                            return {
-                                "summary": response,
-                                "distance": distance,
-                                "duration": duration,
-                                "instructions": instructions,
-                                "end_address": end_address,
-                                "maps_url": maps_url
-                            }
+                    distance = leg["distance"]["text"]
+                    duration = leg["duration"]["text"]
+                    end_address = leg["end_address"]
+                        
+                    # Extract turn-by-turn instructions
+                    # Clean HTML tags and decode entities such as &amp;
+                    instructions = [
+                        f"{html.unescape(_HTML_TAG_RE.sub('', step['html_instructions']))} ({step['distance']['text']})"
+                        for step in leg["steps"]
+                    ]
+                        
+                    # Create Google Maps URL
+                    maps_url = NavigationTools._maps_url(start_lat, start_lon, destination)
+                        
+                    # Format response
+                    parts = [
+                        "🧭 Navigation Route",
+                        f"📍 Destination: {end_address}",
+                        f"📏 Distance: {distance}",
+                        f"⏱️ Duration: {duration}",
+                    ]
+                        
+                    if len(instructions) > 0:
+                        parts.append("")
+                        parts.append("🗺️ Turn-by-Turn Directions:")
+                        parts.extend(f"{i}. {instruction}" for i, instruction in enumerate(instructions[:6], 1))  # Show first 6 steps
                             
+                        if len(instructions) > 6:
+                            parts.append(f"... and {len(instructions) - 6} more steps")
+                        
+                    parts.append("")
+                    parts.append(f"🌐 Open in Google Maps: {maps_url}")
+                    response = "\n".join(parts)
+                        
+                    return {
+                        "summary": response,
+                        "distance": distance,
+                        "duration": duration,
+                        "instructions": instructions,
+                        "end_address": end_address,
+                        "maps_url": maps_url
+                    }
+                        
         except Exception as e:
             logger.warning(f"Google Directions API failed: {e}")
         
@@ -1047,6 +1192,13 @@ class NavigationTools:
             }
             
             google_type = google_types.get(place_type, "establishment")
+            
+            # ~100 m cells; distances are from the first query in the cell
+            cache_key = (round(latitude, 3), round(longitude, 3), google_type, radius_m)
+            cached = _cache_get(_PLACES_CACHE, cache_key, _PLACES_TTL_S)
+            if cached is not None:
+                return list(cached)
+            
             logger.info(f"🔧 Mapping place_type '{place_type}' to Google type '{google_type}'")
             
             url = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
@@ -1057,72 +1209,73 @@ class NavigationTools:
                 "key": api_key
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        if data.get("status") == "OK":
-                            places = []
-                            for result in data.get("results", [])[:10]:  # Get up to 10 results
-                                place_location = result.get("geometry", {}).get("location", {})
-                                place_lat = place_location.get("lat")
-                                place_lng = place_location.get("lng")
-                                
-                                if place_lat and place_lng:
-                                    distance = NavigationTools._calculate_distance(latitude, longitude, place_lat, place_lng)
-                                    
-                                    # Determine category from place types
-                                    place_types = result.get("types", [])
-                                    category = NavigationTools._determine_category(place_types)
-                                    
-                                    places.append({
-                                        'name': result.get("name", "Unknown Place"),
-                                        'distance': distance,
-                                        'rating': result.get("rating"),
-                                        'address': result.get("vicinity", ""),
-                                        'place_id': result.get("place_id"),
-                                        'types': place_types,
-                                        'category': category
-                                    })
-                            
-                            # Sort by distance
-                            places.sort(key=lambda x: x['distance'])
-                            logger.info(f"🔧 Found {len(places)} places of type '{google_type}'")
-                            return places
+            status, data = await _get_json(url, params, timeout=10)
+            if status == 200:
+                    
+                if data.get("status") == "OK":
+                    places = []
+                    lat0_rad = math.radians(latitude)
+                    cos_lat0 = math.cos(lat0_rad)
+                    for result in data.get("results", [])[:10]:  # Get up to 10 results
+                        place_location = result.get("geometry", {}).get("location", {})
+                        place_lat = place_location.get("lat")
+                        place_lng = place_location.get("lng")
                             
+                        if place_lat and place_lng:
+                            distance = NavigationTools._calculate_distance_fast(lat0_rad, longitude, place_lat, place_lng, cos_lat0)
+                                
+                            # Determine category from place types
+                            place_types = result.get("types", [])
+                            category = NavigationTools._determine_category(place_types)
+                                
+                            places.append({
+                                'name': result.get("name", "Unknown Place"),
+                                'distance': distance,
+                                'rating': result.get("rating"),
+                                'address': result.get("vicinity", ""),
+                                'place_id': result.get("place_id"),
+                                'types': place_types,
+                                'category': category
+                            })
+                        
+                    # Sort by distance
+                    places = heapq.nsmallest(10, places, key=itemgetter('distance'))
+                    logger.info(f"🔧 Found {len(places)} places of type '{google_type}'")
+                    if places:
+                        _cache_put(_PLACES_CACHE, cache_key, places, _API_CACHE_MAX_ENTRIES)
+                        return list(places)
+                    return places
+                        
         except Exception as e:
             logger.warning(f"Google Places API search failed: {e}")
         
         return []
     
+    _TYPE_CATEGORIES: Dict[str, str] = {
+        "tourist_attraction": "Tourist Attraction",
+        "place_of_worship": "Religious Site",
+        "restaurant": "Restaurant",
+        "lodging": "Hotel",
+        "hospital": "Medical",
+        "shopping_mall": "Shopping",
+        "bank": "Financial",
+        "gas_station": "Fuel Station",
+        "cafe": "Cafe",
+        "park": "Recreation",
+        "museum": "Cultural Site",
+        "amusement_park": "Entertainment",
+        "zoo": "Wildlife",
+        "church": "Religious Site",
+        "hindu_temple": "Temple",
+        "mosque": "Religious Site"
+    }
+    
     @staticmethod
     def _determine_category(place_types: List[str]) -> str:
         """🔧 ENHANCED: Determine category from Google Places types"""
-        type_categories = {
-            "tourist_attraction": "Tourist Attraction",
-            "place_of_worship": "Religious Site",
-            "restaurant": "Restaurant",
-            "lodging": "Hotel",
-            "hospital": "Medical",
-            "shopping_mall": "Shopping",
-            "bank": "Financial",
-            "gas_station": "Fuel Station",
-            "cafe": "Cafe",
-            "park": "Recreation",
-            "museum": "Cultural Site",
-            "amusement_park": "Entertainment",
-            "zoo": "Wildlife",
-            "church": "Religious Site",
-            "hindu_temple": "Temple",
-            "mosque": "Religious Site"
-        }
-        
-        for place_type in place_types:
-            if place_type in type_categories:
-                return type_categories[place_type]
-        
-        return "Local Business"
+        # First recognised type wins, as Google lists the most specific type first
+        categories = NavigationTools._TYPE_CATEGORIES
+        return next((categories[t] for t in place_types if t in categories), "Local Business")
     
     @staticmethod
     def _format_weather_response(api_data: Dict) -> Dict:
@@ -1187,9 +1340,40 @@ class NavigationTools:
     
     @staticmethod
     async def _get_address_from_coords(latitude: float, longitude: float) -> Optional[str]:
+        """Get address for coordinates, served from the geocode cache when possible"""
+        key = (round(latitude, 4), round(longitude, 4))
+        hit = _GEOCODE_CACHE.get(key)
+        if hit is not None:
+            age = time.monotonic() - hit[0]
+            if age < _GEOCODE_STALE_S:
+                _GEOCODE_CACHE.move_to_end(key)
+                if age >= _GEOCODE_FRESH_S and key not in _geocode_refreshing:
+                    _geocode_refreshing.add(key)
+                    task = asyncio.create_task(NavigationTools._refresh_geocode(key, latitude, longitude))
+                    _geocode_tasks.add(task)
+                    task.add_done_callback(_geocode_tasks.discard)
+                return hit[1]
+        
+        address = await NavigationTools._fetch_address_from_coords(latitude, longitude)
+        if address:
+            _cache_put(_GEOCODE_CACHE, key, address, _GEOCODE_MAX_ENTRIES)
+        return address
+    
+    @staticmethod
+    async def _refresh_geocode(key: Tuple[float, float], latitude: float, longitude: float):
+        """Background refresh of a stale geocode entry"""
+        try:
+            address = await NavigationTools._fetch_address_from_coords(latitude, longitude)
+            if address:
+                _cache_put(_GEOCODE_CACHE, key, address, _GEOCODE_MAX_ENTRIES)
+        finally:
+            _geocode_refreshing.discard(key)
+    
+    @staticmethod
+    async def _fetch_address_from_coords(latitude: float, longitude: float) -> Optional[str]:
         """Get address using Google Geocoding API"""
         try:
-            google_api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+            google_api_key = _GOOGLE_KEY
             if not google_api_key:
                 return None
             
@@ -1199,42 +1383,40 @@ class NavigationTools:
                 "key": google_api_key
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=5)) as response:
-                    if response.status == 200:
-                        data = await response.json()
+            status, data = await _get_json(url, params, timeout=5)
+            if status == 200:
+                    
+                if data.get("status") == "OK" and data.get("results"):
+                    result = data["results"][0]
                         
-                        if data.get("status") == "OK" and data.get("results"):
-                            result = data["results"][0]
-                            
-                            # Extract city, state, country
-                            address_components = result.get("address_components", [])
-                            city = ""
-                            state = ""
-                            country = ""
-                            
-                            for component in address_components:
-                                types = component.get("types", [])
-                                if "locality" in types:
-                                    city = component.get("long_name", "")
-                                elif "administrative_area_level_1" in types:
-                                    state = component.get("short_name", "")
-                                elif "country" in types:
-                                    country = component.get("short_name", "")
-                            
-                            # Format nicely
-                            if city and state and country:
-                                return f"{city}, {state}, {country}"
-                            elif city and country:
-                                return f"{city}, {country}"
-                            else:
-                                formatted_address = result.get("formatted_address", "")
-                                if formatted_address:
-                                    parts = formatted_address.split(',')
-                                    if len(parts) >= 2:
-                                        return f"{parts[0].strip()}, {parts[-1].strip()}"
-                                    return parts[0].strip()
-                                    
+                    # Extract city, state, country
+                    address_components = result.get("address_components", [])
+                    city = ""
+                    state = ""
+                    country = ""
+                        
+                    for component in address_components:
+                        types = component.get("types", [])
+                        if "locality" in types:
+                            city = component.get("long_name", "")
+                        elif "administrative_area_level_1" in types:
+                            state = component.get("short_name", "")
+                        elif "country" in types:
+                            country = component.get("short_name", "")
+                        
+                    # Format nicely
+                    if city and state and country:
+                        return f"{city}, {state}, {country}"
+                    elif city and country:
+                        return f"{city}, {country}"
+                    else:
+                        formatted_address = result.get("formatted_address", "")
+                        if formatted_address:
+                            parts = formatted_address.split(',')
+                            if len(parts) >= 2:
+                                return f"{parts[0].strip()}, {parts[-1].strip()}"
+                            return parts[0].strip()
+                                
         except Exception as e:
             logger.warning(f"Google Geocoding failed: {e}")
         
@@ -1243,18 +1425,34 @@ class NavigationTools:
     @staticmethod
     def _calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """Calculate distance between two points in kilometers"""
-        import math
+        sin, cos, asin, sqrt, radians = math.sin, math.cos, math.asin, math.sqrt, math.radians
         
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+        lat1, lon1, lat2, lon2 = radians(lat1), radians(lon1), radians(lat2), radians(lon2)
         dlat = lat2 - lat1
         dlon = lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
+        a = sin(dlat/2)**2 + cos(lat1) * cos(lat2) * sin(dlon/2)**2
+        c = 2 * asin(sqrt(a))
         
-        return c * 6371  # Earth's radius in km
+        return c * _EARTH_R_KM
+    
+    @staticmethod
+    def _calculate_distance_fast(lat1: float, lon1: float, lat2: float, lon2: float, _cos_lat1: float) -> float:
+        """Equirectangular distance in km; lat1 in radians, within 0.5% of Haversine up to ~50 km"""
+        dlat = math.radians(lat2) - lat1
+        dlon = math.radians(lon2 - lon1) * _cos_lat1
+        return math.sqrt(dlat * dlat + dlon * dlon) * _EARTH_R_KM
 
 # ====================== VEHICLE INFORMATION TOOLS ======================
 
+# search_vehicle_by_criteria keywords, checked in order; the first hit wins
+_CRITERIA_VEHICLES = {
+    "electric": "tesla model 3",
+    "luxury": "bmw 3 series",
+    "reliable": "honda civic",
+    "fuel efficient": "honda civic",
+    "truck": "ford f150",
+}
+
 class VehicleInfoTools:
     """Vehicle information database tools"""
     
@@ -1295,71 +1493,57 @@ class VehicleInfoTools:
     }
     
     @staticmethod
-    async def get_vehicle_info(vehicle_query: str, info_type: str = "general") -> Dict:
-        """Get vehicle information"""
-        try:
-            # Find vehicle in database
-            vehicle_data = None
-            for vehicle_id, data in VehicleInfoTools.VEHICLE_DB.items():
-                if any(word in vehicle_query.lower() for word in vehicle_id.split('_')):
+    @functools.lru_cache(maxsize=256)
+    def _vehicle_info_response(vehicle_query: str, info_type: str) -> Dict:
+        """Build the get_vehicle_info reply; VEHICLE_DB is static, so memoized (read-only!)"""
+        # Find vehicle in database: whole-word hits first, then the substring scan
+        query_lower = vehicle_query.lower()
+        vehicle_data = None
+        for token in query_lower.split():
+            vehicle_id = VehicleInfoTools._TOKEN_INDEX.get(token)
+            if vehicle_id:
+                vehicle_data = VehicleInfoTools.VEHICLE_DB[vehicle_id]
+                break
+        else:
+            for id_words, name_lower, data in VehicleInfoTools._SCAN_ENTRIES:
+                if any(word in query_lower for word in id_words):
                     vehicle_data = data
                     break
-                elif data["name"].lower() in vehicle_query.lower():
+                elif name_lower in query_lower:
                     vehicle_data = data
                     break
-            
-            if not vehicle_data:
-                available_vehicles = ", ".join([data["name"] for data in VehicleInfoTools.VEHICLE_DB.values()])
-                return {
-                    "success": True,
-                    "message": f"I don't have information about '{vehicle_query}'. I can tell you about: {available_vehicles}"
-                }
-            
-            # Get specific information type
-            info = vehicle_data.get(info_type, vehicle_data["general"])
-            vehicle_name = vehicle_data["name"]
-            
-            response = f"📋 {vehicle_name} - {info_type.title()} Information:\n\n{info}"
-            
+        
+        if not vehicle_data:
             return {
                 "success": True,
-                "message": response,
-                "vehicle": vehicle_name
+                "message": f"I don't have information about '{vehicle_query}'. I can tell you about: {VehicleInfoTools._AVAILABLE_NAMES}"
             }
-            
+        
+        # Get specific information type
+        info = vehicle_data.get(info_type, vehicle_data["general"])
+        vehicle_name = vehicle_data["name"]
+        
+        response = f"📋 {vehicle_name} - {info_type.title()} Information:\n\n{info}"
+        
+        return {
+            "success": True,
+            "message": response,
+            "vehicle": vehicle_name
+        }
+    
+    @staticmethod
+    async def get_vehicle_info(vehicle_query: str, info_type: str = "general") -> Dict:
+        """Get vehicle information"""
+        try:
+            return VehicleInfoTools._vehicle_info_response(vehicle_query, info_type)
         except Exception as e:
             return {"success": False, "message": f"Failed to get vehicle info: {e}"}
     
     @staticmethod
     async def list_available_vehicles() -> Dict:
         """List all available vehicles"""
-        try:
-            vehicles = []
-            cars = []
-            trucks = []
-            
-            for vehicle_id, data in VehicleInfoTools.VEHICLE_DB.items():
-                vehicle_info = f"- {data['name']}: {data['type']}"
-                vehicles.append(vehicle_info)
-                
-                if "truck" in data["type"].lower():
-                    trucks.append(vehicle_info)
-                else:
-                    cars.append(vehicle_info)
-            
-            response = "🚗 Available Vehicle Information:\n\n"
-            response += "Cars:\n" + "\n".join(cars) + "\n\n"
-            response += "Trucks:\n" + "\n".join(trucks) + "\n\n"
-            response += "Ask me about any vehicle! For example: 'Tell me about the Tesla Model 3' or 'What are the features of the BMW 3 Series?'"
-            
-            return {
-                "success": True,
-                "message": response,
-                "vehicles": list(VehicleInfoTools.VEHICLE_DB.values())
-            }
-            
-        except Exception as e:
-            return {"success": False, "message": f"Failed to list vehicles: {e}"}
+        # Built once at import from the static VEHICLE_DB (read-only!)
+        return VehicleInfoTools._LIST_RESPONSE
     
     @staticmethod
     async def compare_vehicles(vehicle1: str, vehicle2: str) -> Dict:
@@ -1379,46 +1563,84 @@ class VehicleInfoTools:
         try:
             criteria_lower = criteria.lower()
             
-            if "electric" in criteria_lower:
-                return await VehicleInfoTools.get_vehicle_info("tesla model 3")
-            elif "luxury" in criteria_lower:
-                return await VehicleInfoTools.get_vehicle_info("bmw 3 series")
-            elif "reliable" in criteria_lower or "fuel efficient" in criteria_lower:
-                return await VehicleInfoTools.get_vehicle_info("honda civic")
-            elif "truck" in criteria_lower:
-                return await VehicleInfoTools.get_vehicle_info("ford f150")
-            else:
-                return {
-                    "success": True,
-                    "message": "I can help you find vehicles based on criteria like: electric, luxury, reliable, fuel efficient, or truck capabilities."
-                }
+            for keyword, vehicle_query in _CRITERIA_VEHICLES.items():
+                if keyword in criteria_lower:
+                    return await VehicleInfoTools.get_vehicle_info(vehicle_query)
+            
+            return {
+                "success": True,
+                "message": "I can help you find vehicles based on criteria like: electric, luxury, reliable, fuel efficient, or truck capabilities."
+            }
                 
         except Exception as e:
             return {"success": False, "message": f"Failed to search by criteria: {e}"}
 
+def _build_vehicle_token_index(vehicle_db: Dict[str, Dict]) -> Dict[str, str]:
+    """Map each id/name word (3+ chars) to its vehicle; earlier entries win"""
+    index: Dict[str, str] = {}
+    for vehicle_id, data in vehicle_db.items():
+        for token in vehicle_id.split('_') + data["name"].lower().split():
+            if len(token) >= 3:
+                index.setdefault(token, vehicle_id)
+    return index
+
+def _build_vehicle_list_response(vehicle_db: Dict[str, Dict]) -> Dict:
+    """The list_available_vehicles reply, grouped into cars and trucks"""
+    cars = []
+    trucks = []
+    
+    for data in vehicle_db.values():
+        vehicle_info = f"- {data['name']}: {data['type']}"
+        
+        if "truck" in data["type"].lower():
+            trucks.append(vehicle_info)
+        else:
+            cars.append(vehicle_info)
+    
+    response = "🚗 Available Vehicle Information:\n\n"
+    response += "Cars:\n" + "\n".join(cars) + "\n\n"
+    response += "Trucks:\n" + "\n".join(trucks) + "\n\n"
+    response += "Ask me about any vehicle! For example: 'Tell me about the Tesla Model 3' or 'What are the features of the BMW 3 Series?'"
+    
+    return {
+        "success": True,
+        "message": response,
+        "vehicles": list(vehicle_db.values())
+    }
+
+VehicleInfoTools._TOKEN_INDEX = _build_vehicle_token_index(VehicleInfoTools.VEHICLE_DB)
+# Fallback substring scan inputs, split/lowercased once; kept out of VEHICLE_DB
+# itself because list_available_vehicles returns those dicts to the frontend
+VehicleInfoTools._SCAN_ENTRIES = tuple(
+    (tuple(vehicle_id.split('_')), data["name"].lower(), data)
+    for vehicle_id, data in VehicleInfoTools.VEHICLE_DB.items()
+)
+VehicleInfoTools._LIST_RESPONSE = _build_vehicle_list_response(VehicleInfoTools.VEHICLE_DB)
+VehicleInfoTools._AVAILABLE_NAMES = ", ".join(data["name"] for data in VehicleInfoTools.VEHICLE_DB.values())
+
 # Initialize music system
 def initialize_music_system():
     """Initialize music system and load real music files"""
-    music_dir = "data/music"
+    global _STATE_VERSION
+    music_dir = MUSIC_DIR
     os.makedirs(music_dir, exist_ok=True)
     
     try:
-        # Initialize pygame mixer with better settings for music
-        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=512)
-        pygame.mixer.init()
+        # Find actual music files from the single scandir pass behind _TRACK_PATHS,
+        # grouped by extension in the same order the old per-extension globs gave
+        _rebuild_track_index()
+        music_files: Dict[str, List[str]] = {'mp3': [], 'wav': [], 'ogg': [], 'm4a': []}
         
-        # Find actual music files
-        import glob
-        supported_extensions = ['*.mp3', '*.wav', '*.ogg', '*.m4a']
-        music_files = []
+        for name in _TRACK_PATHS:
+            _, dot, ext = name.rpartition('.')
+            files = music_files.get(ext) if dot else None
+            if files is not None and not name.startswith('.'):
+                files.append(name)
         
-        for ext in supported_extensions:
-            files = glob.glob(os.path.join(music_dir, ext))
-            music_files.extend(files)
+        playlist = [name for files in music_files.values() for name in files]
         
-        if music_files:
+        if playlist:
             # Use real filenames
-            playlist = [os.path.basename(f) for f in music_files]
             VEHICLE_STATE["music"]["playlist"] = playlist
             VEHICLE_STATE["music"]["current_track"] = playlist[0]
             logger.info(f"🎵 Real music system initialized with {len(playlist)} files: {playlist}")
@@ -1433,6 +1655,9 @@ def initialize_music_system():
         # Fallback playlist
         VEHICLE_STATE["music"]["playlist"] = ["Music system error"]
         VEHICLE_STATE["music"]["current_track"] = "Music system error"
+    
+    # current_track was written directly, not via update_vehicle_state
+    _STATE_VERSION += 1
 
 # Initialize on import
 initialize_music_system()
\ No newline at end of file